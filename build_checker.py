@@ -1,17 +1,61 @@
 """
 checker.html ビルドスクリプト
 fsa_all.json のデータを checker.html に埋め込み、3リスト対応版を生成する。
+query_log.tsv（匿名化した検索ログ）があれば、頻出クエリの判定結果も埋め込む。
 """
 
-import json, re, sys
+import hashlib, json, random, re, shutil, subprocess, sys
 from pathlib import Path
 
+from fsa_lookup import (build_prefilter, build_key_index, build_belongs_join, build_facets,
+                        encode_bitset, entry_reg_key, entry_corp_no, entry_phone, WARNING_LIST,
+                        FsaIndex, load_query_log, build_hot_verdicts, QUERY_LOG)
+
 sys.stdout.reconfigure(encoding="utf-8")
 
 CHECKER_HTML = "checker.html"
 ALL_JSON     = "fsa_all.json"
 START_MARK   = "/* EMBEDDED_DB_START */"
 END_MARK     = "/* EMBEDDED_DB_END */"
+PREFILTER_SAMPLES = 5  # 事前判定の検査で名前ごとに試す部分文字列の数
+
+
+def prefilter_samples(entries: list[dict], per_name: int = PREFILTER_SAMPLES) -> list[str]:
+    """
+    登録名の部分文字列の見本（searchDB() で必ずヒットするので「確実に未登録」になってはいけない）。
+    UTF-16 で 2 単位になる文字（𣘺 や異体字セレクタ）を含む名前は全ての部分文字列を、
+    ほかは名前ごとに全体と per_name 個の部分文字列を試す。
+    """
+    rng = random.Random(0)
+    samples = set()
+    for name in {e["name_n"] for e in entries if e.get("name_n")}:
+        if any(ord(c) > 0xFFFF for c in name):
+            samples.update(name[i:j] for i in range(len(name)) for j in range(i + 1, len(name) + 1))
+            continue
+        samples.add(name)
+        for _ in range(per_name):
+            i, j = sorted(rng.sample(range(len(name) + 1), 2)) if len(name) > 1 else (0, 1)
+            samples.add(name[i:j])
+    return sorted(samples)
+
+
+def check_prefilter_js(js: str, p_json: str, samples: list[str]) -> list[str] | None:
+    """
+    checker.html に埋め込む definitelyUnregistered() を node で実行し、「確実に未登録」と
+    判定された見本を返す。node が無ければ None。
+    """
+    if not shutil.which("node"):
+        return None
+    script = (
+        "const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n"
+        "const EMBEDDED_PREFILTER = input.prefilter;\n"
+        f"{js}\n"
+        "console.log(JSON.stringify(input.samples.filter(s => definitelyUnregistered(s))));\n"
+    )
+    stdin = '{"prefilter":' + p_json + ',"samples":' + json.dumps(samples) + '}'
+    result = subprocess.run(["node", "-e", script], input=stdin, capture_output=True,
+                            text=True, encoding="utf-8", check=True)
+    return json.loads(result.stdout)
 
 # ── JSON 読み込み ──────────────────────────────────────────
 print("fsa_all.json を読み込み中...")
@@ -21,15 +65,67 @@ with open(ALL_JSON, encoding="utf-8") as f:
 kinyushohin = data["kinyushohin"]
 chuukai     = data["chuukai"]
 touroku     = data["touroku"]
+mutouroku   = data.get(WARNING_LIST, [])
 generated   = data["generated"]
 
 k_json = json.dumps(kinyushohin, ensure_ascii=False, separators=(',', ':'))
 c_json = json.dumps(chuukai,     ensure_ascii=False, separators=(',', ':'))
 t_json = json.dumps(touroku,     ensure_ascii=False, separators=(',', ':'))
+m_json = json.dumps(mutouroku,   ensure_ascii=False, separators=(',', ':'))
 
 print(f"  金融商品取引業者: {len(kinyushohin)} 件")
 print(f"  金融商品仲介業者: {len(chuukai)} 件")
 print(f"  登録金融機関:     {len(touroku)} 件")
+print(f"  警告業者:         {len(mutouroku)} 件")
+
+# DB 配列（checker.html 側）と同じ順序。索引はこの通し番号を指す。
+# 警告業者も同じ配列・同じ索引に載せ、1 回の照会で登録と警告の両方が分かるようにする
+entries = kinyushohin + chuukai + touroku + mutouroku
+
+# ── 未登録の事前判定フィルタ ───────────────────────────────
+prefilter = build_prefilter(entries)
+p_json = json.dumps(prefilter, ensure_ascii=False, separators=(',', ':'))
+print(f"  事前判定フィルタ: {len(p_json):,} バイト")
+
+# ── 完全一致索引（登録番号・法人番号・電話番号 → 通し番号） ─
+index = {
+    "reg":   build_key_index(entries, entry_reg_key),
+    "corp":  build_key_index(entries, entry_corp_no),
+    "phone": build_key_index(entries, entry_phone),
+}
+i_json = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+print(f"  登録番号索引: {len(index['reg'])} 件 / 法人番号索引: {len(index['corp'])} 件"
+      f" / 電話番号索引: {len(index['phone'])} 件")
+
+# ── 仲介業者 ⇔ 所属金融商品取引業者等（隣接リスト） ─────────
+join = build_belongs_join(entries)
+j_json = json.dumps(join, separators=(',', ':'))
+print(f"  所属先リンク: {len(join['parents']['adj'])} 件")
+
+# ── 絞り込み用ビットセット（facet → 値 → base64） ──────────
+facets = {
+    facet: {value: encode_bitset(bits, len(entries)) for value, bits in values.items()}
+    for facet, values in build_facets(entries).items()
+}
+f_json = json.dumps(facets, ensure_ascii=False, separators=(',', ':'))
+print(f"  絞り込み条件: {sum(len(v) for v in facets.values())} 種 / {len(f_json):,} バイト")
+
+# ── 頻出クエリの判定表（検索結果キャッシュの 2 段目） ──────
+query_counts = load_query_log()
+# 判定に効く項目の内容ハッシュ（DB 順）。データが変われば画面側のキャッシュを捨てさせる。
+# 日付と件数だけだと、同じ日の再生成や件数の変わらない修正でキャッシュが残ってしまう
+content = "\n".join(
+    "\t".join(e.get(k, "") for k in ("name_n", "addr_n", "reg_no", "category")) for e in entries
+)
+hot = {
+    "version":  hashlib.sha1(content.encode("utf-8")).hexdigest(),
+    "verdicts": build_hot_verdicts(FsaIndex(entries), query_counts),
+}
+h_json = json.dumps(hot, ensure_ascii=False, separators=(',', ':'))
+if query_counts:
+    print(f"  頻出クエリ: {QUERY_LOG} の {len(query_counts)} 種から上位 {len(hot['verdicts'])} 件を事前判定")
+else:
+    print(f"  頻出クエリ: {QUERY_LOG} が無いため事前判定なし")
 
 # ── checker.html 読み込み ──────────────────────────────────
 print("checker.html を読み込み中...")
@@ -38,9 +134,15 @@ html = Path(CHECKER_HTML).read_text(encoding="utf-8")
 # ── データ埋め込み部分を置換 ──────────────────────────────
 new_db_block = (
     f"{START_MARK}\n"
+    f"const EMBEDDED_PREFILTER={p_json};\n"
+    f"const EMBEDDED_INDEX={i_json};\n"
+    f"const EMBEDDED_JOIN={j_json};\n"
+    f"const EMBEDDED_FACETS={f_json};\n"
+    f"const EMBEDDED_HOT={h_json};\n"
     f"const EMBEDDED_KINYUSHOHIN={k_json};\n"
     f"const EMBEDDED_CHUUKAI={c_json};\n"
     f"const EMBEDDED_TOUROKU={t_json};\n"
+    f"const EMBEDDED_MUTOUROKU={m_json};\n"
     f"{END_MARK}"
 )
 
@@ -76,6 +178,119 @@ function normalize(str) {
   return str.replace(/[\s\u3000]/g, '').toLowerCase();
 }
 
+// --- 未登録の事前判定（Bloom フィルタ、fsa_lookup.py と同一仕様） ---
+function fnv1a(str, seed) {
+  let h = seed;
+  for (let i = 0; i < str.length; i++) {
+    h = Math.imul(h ^ str.charCodeAt(i), 0x01000193) >>> 0;
+  }
+  return h;
+}
+
+function decodeBloom(f) {
+  const bin = atob(f.bits);
+  const bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  return { m: f.m, k: f.k, bytes };
+}
+
+function bloomHas(f, key) {
+  const h1 = fnv1a(key, 0x811C9DC5);
+  const h2 = (fnv1a(key, (0x811C9DC5 ^ 0x9E3779B9) >>> 0) | 1) >>> 0;
+  for (let i = 0; i < f.k; i++) {
+    const p = ((h1 + Math.imul(i, h2)) >>> 0) % f.m;
+    if (!(f.bytes[p >> 3] & (1 << (p & 7)))) return false;
+  }
+  return true;
+}
+
+const PREFILTER = {
+  gram: decodeBloom(EMBEDDED_PREFILTER.gram),
+  name: decodeBloom(EMBEDDED_PREFILTER.name),
+};
+const GRAM_N = 3;
+
+// searchDB() で 1 件もヒットしないことが確実なら true（false は「要全件検索」）
+function definitelyUnregistered(normName) {
+  if (!normName) return false;
+  // gram はコードポイント単位（fsa_lookup.ngrams と同じ）。slice だとサロゲートペアが割れる
+  const chars = Array.from(normName);
+  let allGrams = true;
+  for (let i = 0; i + GRAM_N <= chars.length; i++) {
+    if (!bloomHas(PREFILTER.gram, chars.slice(i, i + GRAM_N).join(''))) { allGrams = false; break; }
+  }
+  if (allGrams) return false;
+  for (let i = 0; i < chars.length; i++) {
+    for (let j = i + 1; j <= chars.length; j++) {
+      if (bloomHas(PREFILTER.name, chars.slice(i, j).join(''))) return false;
+    }
+  }
+  return true;
+}
+
+// --- 完全一致検索（登録番号・法人番号・電話番号、fsa_lookup.py と同一仕様） ---
+function toHalfDigits(str) {
+  return str.replace(/[０-９]/g, c => String.fromCharCode(c.charCodeAt(0) - 0xFEE0));
+}
+
+function parseRegNo(str) {
+  const s = toHalfDigits((str || '').replace(/[\s\u3000]/g, ''));
+  const m = s.match(/^(.*?(?:財務局|財務支局|総合事務局))長?[（(]([^)）]+)[)）]第?(\d+)号?$/);
+  return m ? `${m[1]}/${m[2]}/${parseInt(m[3], 10)}` : '';
+}
+
+// 13桁でなければ null、検査用数字が合わなければ ''
+function cleanCorpNo(str) {
+  const s = toHalfDigits((str || '').replace(/[\s\u3000\-－]/g, ''));
+  if (!/^\d{13}$/.test(s)) return null;
+  let total = 0;
+  for (let i = 0; i < 12; i++) total += Number(s[12 - i]) * (i % 2 === 0 ? 1 : 2);
+  return 9 - total % 9 === Number(s[0]) ? s : '';
+}
+
+// 数字だけの形に（ハイフン・括弧・「代表」等の注記を除去、+81 は 0 始まりに）
+function normalizePhone(str) {
+  let s = toHalfDigits(str || '').replace(/＋/g, '+');
+  s = s.split(/内線|ext\.?/i)[0];
+  s = s.replace(/[（(]?(?:代表|直通)[)）]?|TEL[:：]?|電話[:：]?/gi, '').trim();
+  let digits = s.replace(/\D/g, '');
+  if (s.startsWith('+')) {
+    if (digits.startsWith('81')) {
+      digits = digits[2] === '0' ? digits.slice(2) : '0' + digits.slice(2);
+    } else {
+      digits = '+' + digits;
+    }
+  } else if (digits.startsWith('010')) {
+    digits = '+' + digits.slice(3);
+  }
+  return digits.replace('+', '').length >= 6 ? digits : '';
+}
+
+function lookupNumber(query) {
+  const reg = parseRegNo(query);
+  if (reg) return { kind: '登録番号', ids: EMBEDDED_INDEX.reg[reg] || [] };
+  const corp = cleanCorpNo(query);
+  if (corp === '') return { kind: '法人番号', ids: [], invalid: true };
+  if (corp) return { kind: '法人番号', ids: EMBEDDED_INDEX.corp[corp] || [] };
+  const phone = normalizePhone(query);
+  if (phone) return { kind: '電話番号', ids: EMBEDDED_INDEX.phone[phone] || [] };
+  return null;
+}
+
+// --- 仲介業者 ⇔ 所属金融商品取引業者等（ビルド時に解決済みの隣接リスト） ---
+function neighbors(csr, id) {
+  return csr.adj.slice(csr.off[id], csr.off[id + 1]);
+}
+
+function entryLink(id) {
+  return `<a href="#" onclick="showEntry(${id}); return false"
+    style="color:#2b6cb0">${escHtml(DB[id].name)}</a>`;
+}
+
+function showEntry(id) {
+  showModal(isWarning(DB[id]) ? 'alert' : 'safe', DB[id].name, '', DB[id]);
+}
+
 // --- データ読み込み ---
 function loadData() {
   const dot  = document.getElementById('status-dot');
@@ -84,8 +299,10 @@ function loadData() {
     ...EMBEDDED_KINYUSHOHIN,
     ...EMBEDDED_CHUUKAI,
     ...EMBEDDED_TOUROKU,
+    ...EMBEDDED_MUTOUROKU,
   ];
-  const total = DB.length;
+  DB.forEach((entry, i) => { entry.id = i; });
+  const total = DB.length - EMBEDDED_MUTOUROKU.length;
   dot.className = 'status-dot ok';
   text.innerHTML =
     `金融庁データ読込済 — 計 <strong>${total.toLocaleString()}</strong> 件`
@@ -93,28 +310,35 @@ function loadData() {
     + `取引業者 ${EMBEDDED_KINYUSHOHIN.length.toLocaleString()}・`
     + `仲介業者 ${EMBEDDED_CHUUKAI.length.toLocaleString()}・`
     + `登録金融機関 ${EMBEDDED_TOUROKU.length.toLocaleString()}`
+    + (EMBEDDED_MUTOUROKU.length ? `／警告業者 ${EMBEDDED_MUTOUROKU.length.toLocaleString()}` : '')
     + `)</span>`;
   document.getElementById('search-btn').disabled = false;
+  document.getElementById('number-btn').disabled = false;
+  initBrowse();
 }
 
 // ============================================================
 // 検索ロジック
 // ============================================================
+// 登録業者は matched / partial、警告業者は warned に分けて返す（走査は 1 回）
 function searchDB(name, address) {
   const normName = normalize(name);
   const normAddr = normalize(address);
 
-  if (!normName) return { matched: [], partial: [] };
+  if (!normName) return { matched: [], partial: [], warned: [] };
 
   const matched  = [];
   const partial  = [];
+  const warned   = [];
 
   for (const entry of DB) {
     const nameHit =
       entry.name_n.includes(normName) || normName.includes(entry.name_n);
     if (!nameHit) continue;
 
-    if (normAddr && normAddr.length >= 3) {
+    if (isWarning(entry)) {
+      warned.push(entry);
+    } else if (normAddr && normAddr.length >= 3) {
       const addrHit =
         entry.addr_n.includes(normAddr) || normAddr.includes(entry.addr_n);
       if (addrHit) matched.push(entry);
@@ -124,7 +348,11 @@ function searchDB(name, address) {
     }
   }
 
-  return { matched, partial };
+  return { matched, partial, warned };
+}
+
+function isWarning(entry) {
+  return entry.category === WARNING_CATEGORY;
 }
 
 // ============================================================
@@ -140,15 +368,211 @@ function doSearch() {
     return;
   }
 
-  const { matched, partial } = searchDB(name, address);
+  const { type, match } = cachedVerdict(name, address);
+  showModal(type, name, address, match);
+}
+
+// 判定本体（fsa_lookup.FsaIndex.verdict と同じ規則）
+function searchVerdict(name, address) {
+  // 確実に未登録と判定できれば全件走査を省略
+  if (definitelyUnregistered(normalize(name))) return { type: 'danger', match: null };
+
+  const { matched, partial, warned } = searchDB(name, address);
+
+  // 警告業者と社名が完全に一致し、同名の登録業者が無ければ「警告業者」と判定
+  const normName  = normalize(name);
+  const confirmed = warned.find(e => e.name_n === normName);
+  const sameName  = [...matched, ...partial].some(e => e.name_n === normName);
+
+  if (confirmed && !sameName) return { type: 'alert',   match: confirmed };
+  if (matched.length > 0)     return { type: 'safe',    match: matched[0] };
+  if (partial.length > 0)     return { type: 'warning', match: partial[0] };
+  return { type: 'danger', match: null };
+}
+
+// ============================================================
+// 検索結果キャッシュ
+//   1 段目: このタブ内の LRU（sessionStorage に保存し再読み込み後も使う）
+//   2 段目: ビルド時に頻出クエリの判定を計算した表（EMBEDDED_HOT）
+// 値は [判定, DB の通し番号（該当なしは -1）]
+// ============================================================
+const CACHE_MAX     = 100;
+const CACHE_STORAGE = 'fsa-checker-verdicts';
+let verdictCache = null;   // Map の挿入順を LRU の順序に使う
+
+function cacheKey(name, address) {
+  return normalize(name) + '\t' + normalize(address);
+}
+
+function loadVerdictCache() {
+  verdictCache = new Map();
+  try {
+    const saved = JSON.parse(sessionStorage.getItem(CACHE_STORAGE));
+    // データを更新したビルドでは通し番号が変わるので捨てる
+    if (saved && saved.version === EMBEDDED_HOT.version) verdictCache = new Map(saved.items);
+  } catch (e) { /* sessionStorage が使えない環境ではこのページ内だけで持つ */ }
+}
+
+function saveVerdictCache() {
+  try {
+    sessionStorage.setItem(CACHE_STORAGE, JSON.stringify({
+      version: EMBEDDED_HOT.version,
+      items:   [...verdictCache],
+    }));
+  } catch (e) { /* 容量超過・無効時は保存しない */ }
+}
+
+function cachedVerdict(name, address) {
+  if (!verdictCache) loadVerdictCache();
+  const key = cacheKey(name, address);
+
+  let hit = EMBEDDED_HOT.verdicts[key];
+  if (!hit && verdictCache.has(key)) {
+    hit = verdictCache.get(key);
+    verdictCache.delete(key);          // 最近使ったものとして末尾へ
+    verdictCache.set(key, hit);
+  }
+  if (hit) return { type: hit[0], match: hit[1] >= 0 ? DB[hit[1]] : null };
+
+  const verdict = searchVerdict(name, address);
+  verdictCache.set(key, [verdict.type, verdict.match ? verdict.match.id : -1]);
+  if (verdictCache.size > CACHE_MAX) verdictCache.delete(verdictCache.keys().next().value);
+  saveVerdictCache();
+  return verdict;
+}
+
+// ============================================================
+// 番号検索（登録番号・法人番号・電話番号の完全一致）
+// ============================================================
+function doNumberSearch() {
+  const query = document.getElementById('number-query').value.trim();
+
+  if (!query) {
+    document.getElementById('number-query').focus();
+    showFlash('番号を入力してください', 'number-btn');
+    return;
+  }
+
+  const hit = lookupNumber(query);
+  if (!hit) {
+    showFlash('登録番号・法人番号・電話番号のいずれかを入力してください', 'number-btn');
+    return;
+  }
 
-  if (matched.length > 0) {
-    showModal('safe', name, address, matched[0]);
-  } else if (partial.length > 0) {
-    showModal('warning', name, address, partial[0]);
+  if (hit.invalid) {
+    showModal('danger', query, '', null, {
+      title: '実在しない法人番号です',
+      sub:   '検査用数字（先頭1桁）が一致しません。架空の番号を名乗る業者は詐欺の可能性が極めて高いです',
+    });
+  } else if (hit.ids.some(id => isWarning(DB[id]))) {
+    showModal('alert', query, '', DB[hit.ids.find(id => isWarning(DB[id]))], {
+      title: `この${hit.kind}は金融庁が警告している無登録業者のものです`,
+    });
+  } else if (hit.ids.length === 0) {
+    showModal('danger', query, '', null, {
+      title: `この${hit.kind}は金融庁の登録にありません`,
+    });
   } else {
-    showModal('danger', name, address, null);
+    const count = hit.ids.length > 1 ? `（${hit.ids.length}件）` : '';
+    showModal('warning', query, '', DB[hit.ids[0]], {
+      title:   `この${hit.kind}の登録業者が見つかりました${count}`,
+      sub:     '番号だけを流用する詐欺があります。勧誘してきた業者の社名・住所が下記と一致するか確認してください',
+      caption: '登録業者を名乗る別人の可能性があります。下記の電話番号に直接確認してください',
+    });
+  }
+}
+
+// ============================================================
+// 条件で一覧（ビルド時に作ったビットセットの AND で絞り込み）
+// ============================================================
+const FACET_ALL = {
+  category: 'すべてのリスト',
+  business: 'すべての業務種別',
+  bureau:   'すべての財務局',
+  pref:     'すべての都道府県',
+};
+let FACETS = {};   // facet → 値 → Uint32Array（ビット i が DB[i]）
+
+function decodeBitset(b64) {
+  const bin = atob(b64);
+  const words = new Uint32Array(bin.length >> 2);
+  for (let w = 0; w < words.length; w++) {
+    const i = w << 2;
+    words[w] = (bin.charCodeAt(i) | bin.charCodeAt(i + 1) << 8
+      | bin.charCodeAt(i + 2) << 16 | bin.charCodeAt(i + 3) << 24) >>> 0;
   }
+  return words;
+}
+
+function popcount32(x) {
+  x -= (x >>> 1) & 0x55555555;
+  x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+  return Math.imul((x + (x >>> 4)) & 0x0F0F0F0F, 0x01010101) >>> 24;
+}
+
+// skip 以外の選択条件の AND。条件なしなら null（全件）
+function selectedMask(skip) {
+  let mask = null;
+  for (const facet of Object.keys(FACET_ALL)) {
+    const value = document.getElementById(`facet-${facet}`).value;
+    if (!value || facet === skip) continue;
+    const bits = FACETS[facet][value];
+    mask = mask ? mask.map((w, i) => w & bits[i]) : bits.slice();
+  }
+  return mask;
+}
+
+function countBits(bits, mask) {
+  let n = 0;
+  for (let i = 0; i < bits.length; i++) n += popcount32(mask ? bits[i] & mask[i] : bits[i]);
+  return n;
+}
+
+function initBrowse() {
+  for (const [facet, values] of Object.entries(EMBEDDED_FACETS)) {
+    FACETS[facet] = {};
+    const select = document.getElementById(`facet-${facet}`);
+    select.innerHTML = `<option value="">${FACET_ALL[facet]}</option>`;
+    for (const [value, b64] of Object.entries(values)) {
+      FACETS[facet][value] = decodeBitset(b64);
+      const opt = document.createElement('option');
+      opt.value = value;
+      select.appendChild(opt);
+    }
+    select.addEventListener('change', renderBrowse);
+  }
+  renderBrowse();
+}
+
+function renderBrowse() {
+  // 各選択肢の件数（自分以外の条件で絞った上で数える）
+  for (const facet of Object.keys(FACET_ALL)) {
+    const others = selectedMask(facet);
+    for (const opt of document.getElementById(`facet-${facet}`).options) {
+      if (opt.value) opt.textContent = `${opt.value}（${countBits(FACETS[facet][opt.value], others)}）`;
+    }
+  }
+
+  const countEl = document.getElementById('browse-count');
+  const listEl  = document.getElementById('browse-list');
+  const mask = selectedMask('');
+  if (!mask) {
+    countEl.textContent = '条件を選ぶと該当する登録業者を一覧表示します';
+    listEl.innerHTML = '';
+    return;
+  }
+
+  const ids = [];
+  mask.forEach((w, i) => {
+    for (; w; w &= w - 1) ids.push((i << 5) + 31 - Math.clz32(w & -w));
+  });
+  countEl.textContent = `${ids.length.toLocaleString()} 件該当`;
+  // 警告業者（種別「無登録警告業者」を選んだ時だけ出る）は登録業者と見分けられるようにする
+  listEl.innerHTML = ids.map(id => isWarning(DB[id]) ? `
+    <a href="#" class="warned" onclick="showEntry(${id}); return false">⛔ ${escHtml(DB[id].name)}<span class="sub">無登録・警告 ${escHtml(DB[id].warn_date || '')}</span></a>
+  ` : `
+    <a href="#" onclick="showEntry(${id}); return false">${escHtml(DB[id].name)}<span class="sub">${escHtml(DB[id].reg_no || '')}</span></a>
+  `).join('');
 }
 
 document.addEventListener('DOMContentLoaded', () => {
@@ -157,6 +581,9 @@ document.addEventListener('DOMContentLoaded', () => {
       if (e.key === 'Enter') doSearch();
     });
   });
+  document.getElementById('number-query').addEventListener('keydown', e => {
+    if (e.key === 'Enter') doNumberSearch();
+  });
   loadData();
   document.getElementById('search-btn').disabled = true;
 });
@@ -168,41 +595,48 @@ const CATEGORY_LABEL = {
   '金融商品取引業者': '金融商品取引業者',
   '金融商品仲介業者': '金融商品仲介業者',
   '登録金融機関':     '登録金融機関',
+  '無登録警告業者':   '無登録で金融商品取引業を行う者',
 };
 const CATEGORY_EXCEL = {
   '金融商品取引業者': 'https://www.fsa.go.jp/menkyo/menkyoj/kinyushohin.xlsx',
   '金融商品仲介業者': 'https://www.fsa.go.jp/menkyo/menkyoj/chuukai.xlsx',
   '登録金融機関':     'https://www.fsa.go.jp/menkyo/menkyoj/touroku.xlsx',
+  '無登録警告業者':   'https://www.fsa.go.jp/ordinary/chuui/mutouroku.html',
 };
+const WARNING_CATEGORY = '無登録警告業者';
 
 // ============================================================
 // モーダル制御
 // ============================================================
-function showModal(type, name, address, match) {
+// opts: { title, sub, caption } で定型文を差し替える（番号検索など）
+function showModal(type, name, address, match, opts = {}) {
   const modal   = document.getElementById('modal');
   const overlay = document.getElementById('modal-overlay');
 
   modal.className = `modal ${type}`;
 
-  const iconMap  = { danger: '🚨', warning: '⚠️', safe: '✅' };
+  const iconMap  = { alert: '⛔', danger: '🚨', warning: '⚠️', safe: '✅' };
   const titleMap = {
+    alert:   '金融庁が警告している無登録業者です',
     danger:  '金融庁の登録が確認できませんでした',
     warning: '住所情報が一致しません',
     safe:    '金融庁の登録を確認しました',
   };
   const subMap = {
+    alert:   '金融庁・財務局が「無登録で金融商品取引業を行う者」として公表しています。絶対に取引しないでください',
     danger:  '未登録業者への投資は詐欺の可能性が極めて高いです',
     warning: '社名は存在しますが、住所が登録と異なります。確認が必要です',
     safe:    '登録業者として確認されました。ただし登録＝安全ではありません',
   };
 
   document.getElementById('modal-icon').textContent     = iconMap[type];
-  document.getElementById('modal-title').textContent    = titleMap[type];
-  document.getElementById('modal-subtitle').textContent = subMap[type];
+  document.getElementById('modal-title').textContent    = opts.title || titleMap[type];
+  document.getElementById('modal-subtitle').textContent = opts.sub   || subMap[type];
   document.getElementById('query-display').textContent  =
     address ? `${name}（${address}）` : name;
 
   const riskMap = {
+    alert:   { pct: 98, cls: 'high',   label: '詐欺リスク 98%', caption: '金融庁の警告を受けた業者です。すでにお金を払った場合も 188 へ相談してください' },
     danger:  { pct: 83, cls: 'high',   label: '詐欺リスク 83%', caption: '金融庁未登録業者は詐欺の可能性が極めて高いです' },
     warning: { pct: 55, cls: 'medium', label: '詐欺リスク 55%', caption: '住所が登録と異なります。公式サイトで直接確認してください' },
     safe:    { pct: 10, cls: 'low',    label: '詐欺リスク 低',  caption: '登録は確認されましたが、最終判断は公式サイトでご確認ください' },
@@ -212,16 +646,32 @@ function showModal(type, name, address, match) {
   document.getElementById('risk-label-r').textContent = risk.label;
   document.getElementById('risk-pct').textContent     = type !== 'safe' ? risk.label : '登録あり';
   document.getElementById('risk-pct').className       = `risk-pct ${risk.cls}`;
-  document.getElementById('risk-caption').textContent = risk.caption;
+  document.getElementById('risk-caption').textContent = opts.caption || risk.caption;
 
   const bar = document.getElementById('risk-bar');
   bar.className = `risk-bar ${risk.cls}`;
   bar.style.width = '0%';
   setTimeout(() => { bar.style.width = risk.pct + '%'; }, 100);
 
-  // 登録情報
+  // 登録情報（警告業者は公表内容）
   const matchEl = document.getElementById('match-info');
-  if (match && type !== 'danger') {
+  if (match && type === 'alert') {
+    matchEl.style.display = 'block';
+    matchEl.innerHTML = `
+      <div style="margin-bottom:.75rem">
+        <span style="background:#fff5f5;color:#c53030;font-size:.75rem;font-weight:700;
+          padding:.2rem .6rem;border-radius:4px;border:1px solid #feb2b2">${escHtml(CATEGORY_LABEL[WARNING_CATEGORY])}</span>
+      </div>
+      <div class="mi-label">警告業者名</div>
+      <div class="mi-value">${escHtml(match.name)}</div>
+      ${match.address     ? `<div class="mi-label">所在地</div><div class="mi-value">${escHtml(match.address)}</div>` : ''}
+      ${match.phone       ? `<div class="mi-label">電話番号</div><div class="mi-value">${escHtml(match.phone)}</div>` : ''}
+      ${match.url         ? `<div class="mi-label">ホームページ等</div><div class="mi-value" style="word-break:break-all">${escHtml(match.url)}</div>` : ''}
+      ${match.warn_date   ? `<div class="mi-label">警告日</div><div class="mi-value">${escHtml(match.warn_date)}</div>` : ''}
+      ${match.warn_bureau ? `<div class="mi-label">警告した財務局等</div><div class="mi-value">${escHtml(match.warn_bureau)}</div>` : ''}
+      ${match.note        ? `<div class="mi-label">内容</div><div class="mi-value">${escHtml(match.note)}</div>` : ''}
+    `;
+  } else if (match && type !== 'danger') {
     const cat = match.category || '金融商品取引業者';
 
     // 業種バッジ
@@ -251,23 +701,42 @@ function showModal(type, name, address, match) {
         chuukaiFields += `<div class="mi-label">法人・個人の別</div>
           <div class="mi-value">${escHtml(match.corp_type)}</div>`;
       }
-      if (match.belongs) {
+      const parents = neighbors(EMBEDDED_JOIN.parents, match.id);
+      const belongsCount = match.belongs ? match.belongs.split(' / ').length : 0;
+      if (parents.length) {
         chuukaiFields += `<div class="mi-label">所属金融商品取引業者等</div>
+          <div class="mi-value" style="font-size:.85rem">${parents.map(entryLink).join('<br>')}</div>`;
+      }
+      // 名簿と突き合わせできなかった所属先があれば原文も表示
+      if (match.belongs && parents.length < belongsCount) {
+        chuukaiFields += `<div class="mi-label">所属金融商品取引業者等（原文）</div>
           <div class="mi-value" style="font-size:.85rem">${escHtml(match.belongs)}</div>`;
       }
     }
 
+    // 所属する仲介業者（取引業者・登録金融機関）
+    let memberFields = '';
+    const members = cat !== '金融商品仲介業者' ? neighbors(EMBEDDED_JOIN.members, match.id) : [];
+    if (members.length) {
+      memberFields = `<div class="mi-label">所属する金融商品仲介業者（${members.length}件）</div>
+        <div class="mi-value" style="font-size:.85rem;max-height:10rem;overflow-y:auto">
+          ${members.map(entryLink).join('<br>')}
+        </div>`;
+    }
+
     matchEl.style.display = 'block';
     matchEl.innerHTML = `
       ${catBadge}
       <div class="mi-label">登録業者名</div>
       <div class="mi-value">${escHtml(match.name)}</div>
       ${match.reg_no   ? `<div class="mi-label">登録番号</div><div class="mi-value">${escHtml(match.reg_no)}</div>` : ''}
+      ${match.corp_no  ? `<div class="mi-label">法人番号</div><div class="mi-value">${escHtml(match.corp_no)}</div>` : ''}
       ${match.reg_date ? `<div class="mi-label">登録年月日</div><div class="mi-value">${escHtml(match.reg_date)}</div>` : ''}
       ${match.address  ? `<div class="mi-label">登録住所</div><div class="mi-value">${escHtml(match.address)}</div>` : ''}
       ${match.phone    ? `<div class="mi-label">電話番号</div><div class="mi-value">${escHtml(match.phone)}</div>` : ''}
       ${bizTypes}
       ${chuukaiFields}
+      ${memberFields}
     `;
   } else {
     matchEl.style.display = 'none';
@@ -278,7 +747,15 @@ function showModal(type, name, address, match) {
   const cat  = match ? (match.category || '金融商品取引業者') : null;
   const xlsxUrl = cat ? CATEGORY_EXCEL[cat] : null;
 
-  if (type === 'danger') {
+  if (type === 'alert') {
+    actions.innerHTML = `
+      <a class="btn-primary" href="tel:188">☎ 188（消費者ホットライン）に電話する</a>
+      <a class="btn-secondary"
+         href="${CATEGORY_EXCEL[WARNING_CATEGORY]}"
+         target="_blank" rel="noopener">金融庁の警告業者一覧で確認する ↗</a>
+      <a class="btn-secondary" href="index.html#steps">被害にあったときの対処法を見る</a>
+    `;
+  } else if (type === 'danger') {
     actions.innerHTML = `
       <a class="btn-primary" href="tel:188">☎ 188（消費者ホットライン）に電話する</a>
       <a class="btn-secondary"
@@ -329,8 +806,8 @@ function escHtml(str) {
   );
 }
 
-function showFlash(msg) {
-  const btn = document.getElementById('search-btn');
+function showFlash(msg, btnId = 'search-btn') {
+  const btn = document.getElementById(btnId);
   const orig = btn.textContent;
   btn.textContent = '⚠ ' + msg;
   btn.style.background = '#c05621';
@@ -362,6 +839,20 @@ html = html.replace(
     "会社名と住所を入力するだけで、金融庁の<strong>金融商品取引業者・金融商品仲介業者・登録金融機関</strong>の3リストを一括検索できます。"
 )
 
+# ── 事前判定の検査（埋め込む JS で登録名の一部を照会） ───────
+prefilter_js = NEW_JS[NEW_JS.index("// --- 未登録の事前判定"):NEW_JS.index("// --- 完全一致検索")]
+samples = prefilter_samples(entries)
+misses = check_prefilter_js(prefilter_js, p_json, samples)
+if misses is None:
+    print("事前判定の検査をスキップ（node が見つかりません）")
+elif misses:
+    print(f"エラー: 登録名の一部なのに「確実に未登録」と判定される文字列が {len(misses)} 件あります")
+    for s in misses[:10]:
+        print(f"    {s}")
+    sys.exit(1)
+else:
+    print(f"事前判定の検査: 登録名の部分文字列 {len(samples):,} 件で誤判定なし")
+
 # ── 書き出し ──────────────────────────────────────────────
 Path(CHECKER_HTML).write_text(html, encoding="utf-8")
 print(f"\n完了: {CHECKER_HTML} を更新しました")
@@ -0,0 +1,88 @@
+"""
+news.html データビルドスクリプト
+news.json（記事の一覧。手で編集する元データ）から news_data.js を生成する。
+
+news_data.js には記事本体に加えて、次の 2 つを前もって計算して入れておく。
+  - カテゴリ × 並び順ごとの記事番号の配列。ページ側は絞り込み・並べ替えのたびに
+    配列を複製・ソートせず、該当する配列をそのまま使う
+  - 全文検索用の 2 文字（bigram）転置索引。タイトル・本文・出典が対象で、
+    ページ側は検索語の bigram の記事番号リストを積集合して候補を絞る
+
+使い方:
+  python build_news.py
+"""
+
+import json, re, sys, unicodedata
+from pathlib import Path
+
+sys.stdout.reconfigure(encoding="utf-8")
+
+NEWS_JSON = "news.json"
+NEWS_DATA = "news_data.js"
+
+IMPACT_ORDER = {"high": 0, "medium": 1, "info": 2}
+# news.html の並び替えの選択肢。いずれも同順位は news.json の記載順
+SORTS = {
+    "newest": lambda ids, items: sorted(ids, key=lambda i: items[i]["date"], reverse=True),
+    "oldest": lambda ids, items: sorted(ids, key=lambda i: items[i]["date"]),
+    "impact": lambda ids, items: sorted(ids, key=lambda i: IMPACT_ORDER.get(items[i]["impact"], len(IMPACT_ORDER))),
+}
+
+SEARCH_FIELDS = ("title", "body", "source")
+# 文字・数字の連続を 1 語とする（news.html の searchTerms() の /[\p{L}\p{N}]+/u と同じ）
+TERM_RE = re.compile(r'[^\W_]+')
+
+
+def search_terms(text: str) -> list[str]:
+    """NFKC（全角英数→半角など）と小文字化の後、文字・数字の連続に分ける"""
+    return TERM_RE.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def bigrams(term: str) -> list[str]:
+    """語の 2 文字組。1 文字だけの語はその 1 文字をキーにする"""
+    return [term[i:i + 2] for i in range(len(term) - 1)] or [term]
+
+
+def build_search_index(items: list[dict]) -> dict[str, list[int]]:
+    """bigram → 記事番号の昇順リストを差分（先頭は番号そのもの）で詰めたもの"""
+    postings: dict[str, list[int]] = {}
+    for i, n in enumerate(items):
+        grams = {g for f in SEARCH_FIELDS for t in search_terms(n.get(f, "")) for g in bigrams(t)}
+        for g in grams:
+            postings.setdefault(g, []).append(i)
+    return {
+        g: [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+        for g, ids in sorted(postings.items())
+    }
+
+
+# ── news.json 読み込み ─────────────────────────────────────
+print(f"{NEWS_JSON} を読み込み中...")
+items = json.loads(Path(NEWS_JSON).read_text(encoding="utf-8"))
+print(f"  記事: {len(items)} 件")
+
+# ── カテゴリ × 並び順 → 記事番号（items の添字）の配列 ─────────
+by_cat = {"all": list(range(len(items)))}
+for i, n in enumerate(items):
+    by_cat.setdefault(n["cat"], []).append(i)
+
+# reverse=True の sorted も安定なので、同じ日付の記事は記載順のまま並ぶ
+order = {
+    sort: {cat: sort_fn(ids, items) for cat, ids in by_cat.items()}
+    for sort, sort_fn in SORTS.items()
+}
+print(f"  並び順: {len(SORTS)} 種 × カテゴリ {len(by_cat) - 1} 種（+すべて）")
+
+# ── 全文検索用 bigram 転置索引 ─────────────────────────────
+index = build_search_index(items)
+print(f"  検索索引: {len(index):,} 語（bigram）/ 記事番号 {sum(len(v) for v in index.values()):,} 件")
+
+# ── 書き出し ──────────────────────────────────────────────
+data = {"items": items, "order": order, "index": index}
+js = (
+    "// build_news.py が news.json から生成（手で編集しないこと）\n"
+    f"const NEWS_DATA={json.dumps(data, ensure_ascii=False, separators=(',', ':'))};\n"
+)
+with open(NEWS_DATA, "w", encoding="utf-8", newline="\r\n") as f:
+    f.write(js)
+print(f"\n完了: {NEWS_DATA} を更新しました（{len(js.encode('utf-8')):,} バイト）")
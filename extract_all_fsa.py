@@ -5,14 +5,20 @@
   kinyushohin.xlsx  金融商品取引業者
   chuukai.xlsx      金融商品仲介業者
   touroku.xlsx      登録金融機関
+  mutouroku.xlsx    無登録で金融商品取引業を行う者（金融庁の警告業者一覧。任意）
 
 使い方:
   1. pip install openpyxl
-  2. 各Excelを同フォルダに置く
+  2. 各Excelを同フォルダに置く（kinyushohin.pdf もあれば、Excel より新しい時・Excel が無い時は
+     PDF を読み、Excel との突き合わせ結果を表示する。要 pdfplumber）
   3. python extract_all_fsa.py
-  4. fsa_all.json が生成される
+  4. fsa_all.json が生成される（同時に fsa_history.json.gz へ履歴を追記。3 つの登録一覧が
+     すべて読めた時だけ、一覧の作成日の時点のスナップショットとして追記する）
+  5. pyarrow があれば分析用の fsa_all.arrow / fsa_all.parquet も生成される
+     （読み込みは fsa_lookup.load_table()）
 """
 
+import importlib.util
 import json
 import re
 import sys
@@ -27,7 +33,13 @@ except ImportError:
     print("openpyxl が見つかりません: pip install openpyxl")
     sys.exit(1)
 
-OUTPUT_PATH = "fsa_all.json"
+from fsa_lookup import (parse_reg_no, clean_corp_no, normalize_phone, split_belongs, iso_date,
+                        ARROW_PATH, CATEGORIES, WARNING_LIST, WARNING_CATEGORY)
+from fsa_history import load_history, save_history, append_snapshot, HISTORY_PATH
+
+OUTPUT_PATH  = "fsa_all.json"
+PARQUET_PATH = "fsa_all.parquet"
+KINYUSHOHIN_PDF = "kinyushohin.pdf"  # Excel より新しければこちらを使う（extract_fsa_pdf.py）
 DATA_START_ROW = 8  # 全ファイル共通（8行目からデータ開始）
 
 
@@ -60,7 +72,7 @@ def cell_str(value) -> str:
 
 
 def excel_date(value) -> str:
-    """Excelシリアル値 or datetime を文字列に変換"""
+    """Excelシリアル値 or datetime を文字列に変換（和暦の文字列も YYYY-MM-DD に揃える）"""
     if isinstance(value, datetime):
         return value.strftime("%Y-%m-%d")
     if isinstance(value, (int, float)) and value > 1000:
@@ -68,16 +80,43 @@ def excel_date(value) -> str:
         from datetime import timedelta
         base = datetime(1899, 12, 30)
         return (base + timedelta(days=int(value))).strftime("%Y-%m-%d")
-    return cell_str(value)
+    text = cell_str(value)
+    return iso_date(text) or text
+
+
+def jurisdiction_bureau(value) -> str:
+    """所管列（例: 近畿財務局 / 【計17者】）から局名を取り出す。金融庁所管は空文字"""
+    m = re.match(r'\s*(\S+?(?:財務局|財務支局|総合事務局))', str(value or ""))
+    return m.group(1) if m else ""
+
+
+def reg_fields(reg_no: str, bureau: str, kind: str) -> dict:
+    """登録番号を (財務局, 種別, 番号) に分解。番号だけの行は所管・リスト種別で補う"""
+    parsed = parse_reg_no(reg_no, bureau, kind)
+    b, k, n = parsed if parsed else ("", "", None)
+    return {"reg_bureau": b, "reg_kind": k, "reg_num": n}
 
 
 # ============================================================
 # 金融商品取引業者 (kinyushohin.xlsx)
 # ============================================================
 def extract_kinyushohin(xlsx_path: str) -> list[dict]:
+    print(f"読み込み中: {xlsx_path}")
+    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    ws = wb.active
+    companies = kinyushohin_records(ws.iter_rows(min_row=DATA_START_ROW, values_only=True))
+    wb.close()
+    print(f"  → {len(companies)} 件")
+    return companies
+
+
+def kinyushohin_records(rows) -> list[dict]:
+    """Excel と同じ列並びの行を順に読み、社名で重複を除いたレコードにする（PDF 版からも使う）"""
+    COL_JURIS    = 0
     COL_REG_NO   = 1
     COL_REG_DATE = 2
     COL_NAME     = 3
+    COL_CORP_NO  = 4
     COL_ADDRESS  = 6
     COL_PHONE    = 7
     COL_TYPE1    = 8
@@ -87,11 +126,10 @@ def extract_kinyushohin(xlsx_path: str) -> list[dict]:
 
     companies = []
     seen = set()
-    print(f"読み込み中: {xlsx_path}")
-    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
-    ws = wb.active
-
-    for i, row in enumerate(ws.iter_rows(min_row=DATA_START_ROW, values_only=True), DATA_START_ROW):
+    bureau = ""
+    for row in rows:
+        if len(row) > COL_JURIS and row[COL_JURIS]:
+            bureau = jurisdiction_bureau(row[COL_JURIS])
         name = cell_str(row[COL_NAME] if len(row) > COL_NAME else None)
         if not name:
             continue
@@ -106,17 +144,17 @@ def extract_kinyushohin(xlsx_path: str) -> list[dict]:
             "address":  cell_str(row[COL_ADDRESS]  if len(row) > COL_ADDRESS  else None),
             "addr_n":   normalize(cell_str(row[COL_ADDRESS] if len(row) > COL_ADDRESS else None)),
             "reg_no":   cell_str(row[COL_REG_NO]   if len(row) > COL_REG_NO   else None),
+            **reg_fields(cell_str(row[COL_REG_NO] if len(row) > COL_REG_NO else None), bureau, "金商"),
             "reg_date": excel_date(row[COL_REG_DATE] if len(row) > COL_REG_DATE else None),
+            "corp_no":  clean_corp_no(row[COL_CORP_NO] if len(row) > COL_CORP_NO else None),
             "phone":    cell_str(row[COL_PHONE]    if len(row) > COL_PHONE    else None),
+            "phone_n":  normalize_phone(cell_str(row[COL_PHONE] if len(row) > COL_PHONE else None)),
             "type1":    cell_str(row[COL_TYPE1]    if len(row) > COL_TYPE1    else None),
             "type2":    cell_str(row[COL_TYPE2]    if len(row) > COL_TYPE2    else None),
             "advisory": cell_str(row[COL_ADVISORY] if len(row) > COL_ADVISORY else None),
             "mgmt":     cell_str(row[COL_MGMT]     if len(row) > COL_MGMT     else None),
             "category": "金融商品取引業者",
         })
-
-    wb.close()
-    print(f"  → {len(companies)} 件")
     return companies
 
 
@@ -124,9 +162,11 @@ def extract_kinyushohin(xlsx_path: str) -> list[dict]:
 # 金融商品仲介業者 (chuukai.xlsx)
 # ============================================================
 def extract_chuukai(xlsx_path: str) -> list[dict]:
+    COL_JURIS    = 0
     COL_REG_NO   = 1
     COL_REG_DATE = 2
     COL_NAME     = 3
+    COL_CORP_NO  = 4
     COL_ADDRESS  = 6
     COL_PHONE    = 7
     COL_CORPTYPE = 8   # 法人又は個人の別
@@ -134,11 +174,14 @@ def extract_chuukai(xlsx_path: str) -> list[dict]:
 
     companies = []
     seen = set()
+    bureau = ""
     print(f"読み込み中: {xlsx_path}")
     wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
     ws = wb.active
 
     for i, row in enumerate(ws.iter_rows(min_row=DATA_START_ROW, values_only=True), DATA_START_ROW):
+        if len(row) > COL_JURIS and row[COL_JURIS]:
+            bureau = jurisdiction_bureau(row[COL_JURIS])
         name = cell_str(row[COL_NAME] if len(row) > COL_NAME else None)
         if not name:
             continue
@@ -153,8 +196,11 @@ def extract_chuukai(xlsx_path: str) -> list[dict]:
             "address":  cell_str(row[COL_ADDRESS]  if len(row) > COL_ADDRESS  else None),
             "addr_n":   normalize(cell_str(row[COL_ADDRESS] if len(row) > COL_ADDRESS else None)),
             "reg_no":   cell_str(row[COL_REG_NO]   if len(row) > COL_REG_NO   else None),
+            **reg_fields(cell_str(row[COL_REG_NO] if len(row) > COL_REG_NO else None), bureau, "金仲"),
             "reg_date": excel_date(row[COL_REG_DATE] if len(row) > COL_REG_DATE else None),
+            "corp_no":  clean_corp_no(row[COL_CORP_NO] if len(row) > COL_CORP_NO else None),
             "phone":    cell_str(row[COL_PHONE]     if len(row) > COL_PHONE    else None),
+            "phone_n":  normalize_phone(cell_str(row[COL_PHONE] if len(row) > COL_PHONE else None)),
             "corp_type": cell_str(row[COL_CORPTYPE] if len(row) > COL_CORPTYPE else None),
             "belongs":  cell_str(row[COL_BELONGS]   if len(row) > COL_BELONGS  else None),
             "category": "金融商品仲介業者",
@@ -169,19 +215,24 @@ def extract_chuukai(xlsx_path: str) -> list[dict]:
 # 登録金融機関 (touroku.xlsx)
 # ============================================================
 def extract_touroku(xlsx_path: str) -> list[dict]:
+    COL_JURIS    = 0
     COL_REG_NO   = 1
     COL_REG_DATE = 2
     COL_NAME     = 3
+    COL_CORP_NO  = 4
     COL_ADDRESS  = 6
     COL_PHONE    = 7
 
     companies = []
     seen = set()
+    bureau = ""
     print(f"読み込み中: {xlsx_path}")
     wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
     ws = wb.active
 
     for i, row in enumerate(ws.iter_rows(min_row=DATA_START_ROW, values_only=True), DATA_START_ROW):
+        if len(row) > COL_JURIS and row[COL_JURIS]:
+            bureau = jurisdiction_bureau(row[COL_JURIS])
         name = cell_str(row[COL_NAME] if len(row) > COL_NAME else None)
         if not name:
             continue
@@ -196,8 +247,11 @@ def extract_touroku(xlsx_path: str) -> list[dict]:
             "address":  cell_str(row[COL_ADDRESS]  if len(row) > COL_ADDRESS  else None),
             "addr_n":   normalize(cell_str(row[COL_ADDRESS] if len(row) > COL_ADDRESS else None)),
             "reg_no":   cell_str(row[COL_REG_NO]   if len(row) > COL_REG_NO   else None),
+            **reg_fields(cell_str(row[COL_REG_NO] if len(row) > COL_REG_NO else None), bureau, "登金"),
             "reg_date": excel_date(row[COL_REG_DATE] if len(row) > COL_REG_DATE else None),
+            "corp_no":  clean_corp_no(row[COL_CORP_NO] if len(row) > COL_CORP_NO else None),
             "phone":    cell_str(row[COL_PHONE]     if len(row) > COL_PHONE    else None),
+            "phone_n":  normalize_phone(cell_str(row[COL_PHONE] if len(row) > COL_PHONE else None)),
             "category": "登録金融機関",
         })
 
@@ -206,20 +260,202 @@ def extract_touroku(xlsx_path: str) -> list[dict]:
     return companies
 
 
+# ============================================================
+# 無登録で金融商品取引業を行う者（警告業者）(mutouroku.xlsx)
+# ============================================================
+# 財務局ごとに様式が異なるため、列は見出しの文言で探す（先に書いた項目が優先）
+WARNING_COLUMNS = {
+    "name":        ("名称", "氏名", "業者名"),
+    "address":     ("所在地", "住所"),
+    "phone":       ("電話",),
+    "url":         ("ホームページ", "URL", "ＵＲＬ", "ウェブサイト"),
+    "warn_date":   ("警告日", "年月日"),
+    "warn_bureau": ("財務局", "所管"),
+    "note":        ("内容", "備考", "概要"),
+}
+HEADER_SCAN_ROWS = 20
+
+
+def warning_columns(row) -> dict[str, int]:
+    """見出し行なら 項目 → 列番号 を返す（社名と住所の列が無ければ空）"""
+    cols: dict[str, int] = {}
+    for i, value in enumerate(row):
+        text = cell_str(value).replace(" / ", "")
+        for field, words in WARNING_COLUMNS.items():
+            if field not in cols and any(w in text for w in words):
+                cols[field] = i
+                break
+    return cols if "name" in cols and "address" in cols else {}
+
+
+def extract_mutouroku(xlsx_path: str) -> list[dict]:
+    companies = []
+    seen = set()
+    cols: dict[str, int] = {}
+    print(f"読み込み中: {xlsx_path}")
+    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    ws = wb.active
+
+    for i, row in enumerate(ws.iter_rows(values_only=True), 1):
+        if not cols:
+            if i > HEADER_SCAN_ROWS:
+                break
+            cols = warning_columns(row)
+            continue
+
+        def col(field: str):
+            return row[cols[field]] if field in cols and len(row) > cols[field] else None
+
+        name = cell_str(col("name"))
+        if not name:
+            continue
+        key = (normalize(name), normalize(cell_str(col("address"))))
+        if not key[0] or key in seen:
+            continue
+        seen.add(key)
+
+        # 電話番号は複数併記されることがあるので、phone_n は全番号のリストにして索引に載せる
+        phones = re.split(r' / |[、,]', cell_str(col("phone")))
+        companies.append({
+            "name":        name,
+            "name_n":      key[0],
+            "address":     cell_str(col("address")),
+            "addr_n":      key[1],
+            "reg_no":      "",
+            "corp_no":     "",
+            "phone":       cell_str(col("phone")),
+            "phone_n":     [p for p in dict.fromkeys(normalize_phone(s) for s in phones) if p],
+            "url":         cell_str(col("url")),
+            "warn_date":   excel_date(col("warn_date")),
+            "warn_bureau": cell_str(col("warn_bureau")),
+            "note":        cell_str(col("note")),
+            "category":    WARNING_CATEGORY,
+        })
+
+    wb.close()
+    if not cols:
+        print(f"  見出し行（名称・所在地）が見つかりません: {xlsx_path}")
+    print(f"  → {len(companies)} 件")
+    return companies
+
+
+# ============================================================
+# 分析用 Arrow IPC / Parquet 出力
+# ============================================================
+def write_arrow(companies: list[dict]) -> bool:
+    """
+    全件を型付きの列で書き出す。日付は date32、業務種別は bool（取引業者以外は null）、
+    リスト種別などは dictionary 型。Arrow IPC は圧縮なしで書くのでメモリマップで直接読める。
+    pyarrow が無ければ何もしない。
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("pyarrow が見つからないため Arrow/Parquet 出力をスキップ: pip install pyarrow")
+        return False
+
+    def text(key):
+        return [e.get(key) or None for e in companies]
+
+    def flag(key):
+        return [("○" in e[key]) if key in e else None for e in companies]
+
+    def date(key):
+        # 和暦の文字列も変換し、日付として読めない値だけを null にする
+        isos = [iso_date(e.get(key, "")) for e in companies]
+        return [datetime.strptime(d, "%Y-%m-%d").date() if d else None for d in isos]
+
+    label = pa.dictionary(pa.int8(), pa.string())
+    columns = [
+        ("category",   label,         text("category")),
+        ("name",       pa.string(),   text("name")),
+        ("name_n",     pa.string(),   text("name_n")),
+        ("address",    pa.string(),   text("address")),
+        ("addr_n",     pa.string(),   text("addr_n")),
+        ("reg_no",     pa.string(),   text("reg_no")),
+        ("reg_bureau", label,         text("reg_bureau")),
+        ("reg_kind",   label,         text("reg_kind")),
+        ("reg_num",    pa.int32(),    [e.get("reg_num") for e in companies]),
+        ("reg_date",   pa.date32(),   date("reg_date")),
+        ("corp_no",    pa.string(),   text("corp_no")),
+        ("phone",      pa.string(),   text("phone")),
+        ("phone_n",    pa.string(),   text("phone_n")),
+        ("type1",      pa.bool_(),    flag("type1")),
+        ("type2",      pa.bool_(),    flag("type2")),
+        ("advisory",   pa.bool_(),    flag("advisory")),
+        ("mgmt",       pa.bool_(),    flag("mgmt")),
+        ("corp_type",  label,         text("corp_type")),
+        ("belongs",    pa.list_(pa.string()),
+         [split_belongs(e["belongs"]) if "belongs" in e else None for e in companies]),
+    ]
+    table = pa.table({name: pa.array(values, type=t) for name, t, values in columns})
+
+    with pa.OSFile(ARROW_PATH, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    pq.write_table(table, PARQUET_PATH)
+    print(f"分析用: {ARROW_PATH} / {PARQUET_PATH} に保存（{table.num_rows} 行 × {table.num_columns} 列）")
+    return True
+
+
+# ============================================================
+# 金融商品取引業者一覧の読み込み元（Excel / PDF）
+# ============================================================
+def xlsx_as_of(xlsx_path: str) -> str:
+    """見出し部分（データ開始行より上）にある作成日を YYYY-MM-DD で返す（見つからなければ空文字）"""
+    wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
+    rows = list(wb.active.iter_rows(max_row=DATA_START_ROW - 1, values_only=True))
+    wb.close()
+    for row in rows:
+        for value in row:
+            if isinstance(value, datetime):
+                return value.strftime("%Y-%m-%d")
+            if isinstance(value, str) and "現在" in value and iso_date(value):
+                return iso_date(value)
+    return ""
+
+
+def use_kinyushohin_pdf(xlsx_path: Path) -> bool:
+    """
+    Excel より先に PDF だけ更新されることがあるので、作成日を比べて新しい方を使う。
+    同じ日付・日付が読めない時は Excel を優先する。
+    """
+    if not Path(KINYUSHOHIN_PDF).exists():
+        return False
+    if importlib.util.find_spec("pdfplumber") is None:
+        print(f"pdfplumber が無いため {KINYUSHOHIN_PDF} は使わない: pip install pdfplumber")
+        return False
+    from extract_fsa_pdf import pdf_as_of
+    if not xlsx_path.exists():
+        return True
+    pdf_date, xlsx_date = pdf_as_of(KINYUSHOHIN_PDF), xlsx_as_of(str(xlsx_path))
+    print(f"作成日: {xlsx_path} {xlsx_date or '不明'} / {KINYUSHOHIN_PDF} {pdf_date or '不明'}")
+    return bool(pdf_date and xlsx_date) and pdf_date > xlsx_date
+
+
 def main():
     results = {}
+    as_of = {}  # 読めた一覧 → 作成日（YYYY-MM-DD、読めなければ空文字）
 
     for key, fname, extractor in [
         ("kinyushohin", "kinyushohin.xlsx", extract_kinyushohin),
         ("chuukai",     "chuukai.xlsx",     extract_chuukai),
         ("touroku",     "touroku.xlsx",     extract_touroku),
+        (WARNING_LIST,  "mutouroku.xlsx",   extract_mutouroku),
     ]:
         p = Path(fname)
-        if not p.exists():
+        if key == "kinyushohin" and use_kinyushohin_pdf(p):
+            from extract_fsa_pdf import extract_kinyushohin_pdf, pdf_as_of, reconcile, write_reconcile
+            results[key] = extract_kinyushohin_pdf(KINYUSHOHIN_PDF)
+            as_of[key] = pdf_as_of(KINYUSHOHIN_PDF)
+            if p.exists():
+                write_reconcile(reconcile(results[key], extractor(str(p))))
+        elif not p.exists():
             print(f"スキップ（ファイルなし）: {fname}")
             results[key] = []
         else:
             results[key] = extractor(str(p))
+            as_of[key] = xlsx_as_of(str(p))
 
     all_companies = (
         results["kinyushohin"] +
@@ -227,15 +463,20 @@ def main():
         results["touroku"]
     )
 
+    # 一覧の作成日（一覧ごとに違えば古い方。全件がその日以降の状態を表す）
+    dates = [as_of[key] for key in CATEGORIES if as_of.get(key)]
     output = {
         "generated":  datetime.now().strftime("%Y-%m-%d"),
+        "as_of":      min(dates, default=""),
         "count":      len(all_companies),
         "kinyushohin_count": len(results["kinyushohin"]),
         "chuukai_count":     len(results["chuukai"]),
         "touroku_count":     len(results["touroku"]),
+        "mutouroku_count":   len(results[WARNING_LIST]),
         "kinyushohin": results["kinyushohin"],
         "chuukai":     results["chuukai"],
         "touroku":     results["touroku"],
+        WARNING_LIST:  results[WARNING_LIST],
     }
 
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
@@ -245,6 +486,31 @@ def main():
     print(f"  金融商品取引業者: {len(results['kinyushohin'])} 件")
     print(f"  金融商品仲介業者: {len(results['chuukai'])} 件")
     print(f"  登録金融機関:     {len(results['touroku'])} 件")
+    print(f"  警告業者:         {len(results[WARNING_LIST])} 件")
+
+    write_arrow(all_companies)
+
+    # ── スナップショット履歴に追記 ──
+    # 読めなかった一覧の業者を抹消と記録しないよう、3 つの登録一覧が揃った時だけ追記する。
+    # 日付は実行日ではなく一覧の作成日
+    missing = [key for key in CATEGORIES if key not in as_of]
+    if missing:
+        print(f"\n履歴への追記をスキップ: 読めなかった一覧があります（{', '.join(missing)}）")
+        return
+    if len(dates) < len(CATEGORIES):
+        print("\n履歴への追記をスキップ: 作成日の読めない一覧があります")
+        return
+    if len(set(dates)) > 1:
+        print(f"\n注意: 一覧の作成日が揃っていません（{' / '.join(dates)}）。{output['as_of']} として追記します")
+    history = load_history()
+    try:
+        stats = append_snapshot(history, output["as_of"], all_companies)
+    except ValueError as e:
+        print(f"\n履歴への追記をスキップ: {e}")
+    else:
+        save_history(history)
+        print(f"\n履歴: {HISTORY_PATH} に {output['as_of']} 時点として追記（新規 {stats['added']} / 変更 {stats['changed']}"
+              f" / 抹消 {stats['removed']}）")
 
 
 if __name__ == "__main__":
@@ -29,6 +29,9 @@ except ImportError:
     print("  pip install openpyxl")
     sys.exit(1)
 
+from fsa_lookup import clean_corp_no, normalize_phone
+from extract_all_fsa import jurisdiction_bureau, reg_fields
+
 XLSX_PATH   = "kinyushohin.xlsx"
 OUTPUT_PATH = "fsa_advisors.json"
 
@@ -88,16 +91,20 @@ def extract_from_xlsx(xlsx_path: str) -> list[dict]:
     wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
     ws = wb.active
     total = ws.max_row
+    bureau = ""  # 所管が空の行は前の行の値を引き継ぐ（番号だけの登録番号の補完に使う。extract_all_fsa と同じ）
 
     for i, row in enumerate(ws.iter_rows(min_row=DATA_START_ROW, values_only=True), DATA_START_ROW):
         if i % 100 == 0:
             print(f"  行 {i}/{total} 処理中...", end="\r")
 
+        if len(row) > COL_JURISDICTION and row[COL_JURISDICTION]:
+            bureau = jurisdiction_bureau(row[COL_JURISDICTION])
         name = cell_str(row[COL_NAME] if len(row) > COL_NAME else None)
         if not name:
             continue
 
         reg_no  = cell_str(row[COL_REG_NO]   if len(row) > COL_REG_NO   else None)
+        corp_no = clean_corp_no(row[COL_CORP_NO] if len(row) > COL_CORP_NO else None)
         address = cell_str(row[COL_ADDRESS]   if len(row) > COL_ADDRESS  else None)
         phone   = cell_str(row[COL_PHONE]     if len(row) > COL_PHONE    else None)
         reg_date = cell_str(row[COL_REG_DATE] if len(row) > COL_REG_DATE else None)
@@ -117,7 +124,10 @@ def extract_from_xlsx(xlsx_path: str) -> list[dict]:
             "address":  address,
             "addr_n":   normalize(address),
             "reg_no":   reg_no,
+            **reg_fields(reg_no, bureau, "金商"),
+            "corp_no":  corp_no,
             "phone":    phone,
+            "phone_n":  normalize_phone(phone),
             "reg_date": reg_date,
             "type1":    type1,
             "type2":    type2,
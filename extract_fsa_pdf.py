@@ -0,0 +1,202 @@
+"""
+金融庁 金融商品取引業者一覧 PDF → JSON 変換スクリプト
+
+金融庁は一覧を Excel と PDF の両方で公表しているが、更新が PDF に先に反映されることがある。
+kinyushohin.pdf の表を読み、extract_all_fsa.extract_kinyushohin と同じ形式のレコードを作る。
+
+  - ページごとの表の解析はプロセスプールで並列に行う（1 ページずつ独立に解析できるため）
+  - 解析した行はページ順に受け取り、Excel 版と同じ正規化・重複除去の処理（kinyushohin_records）に流す
+  - kinyushohin.xlsx があれば、Excel 版との突き合わせ結果（片方にしかない業者・項目の食い違い）を出す
+
+使い方:
+  1. pip install pdfplumber openpyxl
+  2. kinyushohin.pdf（あれば kinyushohin.xlsx も）を同フォルダに置く
+  3. python extract_fsa_pdf.py
+  4. fsa_kinyushohin_pdf.json と 突き合わせ結果 fsa_pdf_reconcile.json が生成される
+
+kinyushohin.pdf の作成日が kinyushohin.xlsx より新しい場合（xlsx が無い場合も）、
+extract_all_fsa.py も PDF 版を使い、同じ突き合わせ結果を出す。
+"""
+
+import json
+import re
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+sys.stdout.reconfigure(encoding="utf-8")
+
+try:
+    import pdfplumber
+except ImportError:
+    print("pdfplumber が見つかりません: pip install pdfplumber")
+    sys.exit(1)
+
+from extract_all_fsa import extract_kinyushohin, kinyushohin_records
+from fsa_lookup import ERA_DATE_RE, era_date, parse_reg_no
+from fsa_history import record_key
+
+PDF_PATH       = "kinyushohin.pdf"
+XLSX_PATH      = "kinyushohin.xlsx"
+OUTPUT_PATH    = "fsa_kinyushohin_pdf.json"
+RECONCILE_PATH = "fsa_pdf_reconcile.json"
+MIN_COLUMNS    = 12  # 業務の種別（投資運用業）の列まであれば本体の表
+
+# PDF の文字には康熙部首（⾦ U+2FA6 など）が混ざることがあるので通常の漢字に直す
+RADICALS = {c: unicodedata.normalize("NFKC", chr(c)) for c in range(0x2F00, 0x2FD6)}
+LATIN = re.compile(r'[A-Za-zＡ-Ｚａ-ｚ0-9０-９.,&]')
+
+# 突き合わせで比べる項目（表記ゆれの出ない正規化済みの値）
+# Excel 側はセル内改行を「 / 」にしているが、PDF では折り返しと区別できないので比べる前に除く
+RECONCILE_IGNORE = re.compile(r'[\s\u3000/]+')
+RECONCILE_FIELDS = (
+    "name_n", "addr_n", "reg_date", "corp_no", "phone_n", "type1", "type2", "advisory", "mgmt",
+)
+
+
+def join_wrapped(text: str | None) -> str | None:
+    """
+    セル内の改行は列幅による折り返しなので、Excel 版に合わせて詰める。
+    英単語どうしの折り返し（「Japan」「Limited」など）だけは空白でつなぐ。
+    """
+    if text is None:
+        return None
+    text = text.translate(RADICALS)
+    parts = [p.strip() for p in text.split("\n") if p.strip()]
+    out = parts[0] if parts else ""
+    for p in parts[1:]:
+        sep = " " if LATIN.match(out[-1]) and LATIN.match(p[0]) else ""
+        out += sep + p
+    return out
+
+
+# ============================================================
+# ページ単位の解析（プロセスプールのワーカー）
+# ============================================================
+_pdf = None
+
+
+def _open_pdf(path: str) -> None:
+    # ワーカーごとに 1 回だけ開き、割り当てられたページを順に解析する
+    global _pdf
+    _pdf = pdfplumber.open(path)
+
+
+def page_rows(page_no: int) -> list[list]:
+    """1 ページ分のデータ行を Excel と同じ列並びで返す（見出し行・集計表は除く）"""
+    page = _pdf.pages[page_no]
+    rows = []
+    for table in page.find_tables():
+        for row, cells in zip(table.rows, table.extract()):
+            if len(cells) < MIN_COLUMNS:
+                continue
+            cells = [join_wrapped(c) for c in cells]
+            if cells[1] is None and cells[3]:
+                # ページ末尾の行は左端の罫線が取れず、所管・登録番号のセルが欠けることがある。
+                # 行の左側の領域を切り出して登録番号を読み直す
+                x0, top, _, bottom = row.bbox
+                cells[1] = join_wrapped(page.crop((0, top, x0, bottom)).extract_text())
+            if not parse_reg_no(cells[1] or ""):
+                continue
+            cells[2] = era_date(cells[2])
+            rows.append(cells)
+    return rows
+
+
+def iter_pdf_rows(pdf_path: str, workers: int | None = None):
+    """全ページのデータ行をページ順に 1 行ずつ返す。解析は先のページまで並列に進む"""
+    with pdfplumber.open(pdf_path) as pdf:
+        n_pages = len(pdf.pages)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_open_pdf, initargs=(pdf_path,)) as ex:
+        for rows in ex.map(page_rows, range(n_pages)):
+            yield from rows
+
+
+def pdf_as_of(pdf_path: str) -> str:
+    """1 ページ目の「令和8年1月31日 現在」を YYYY-MM-DD で返す（見つからなければ空文字）"""
+    with pdfplumber.open(pdf_path) as pdf:
+        text = (pdf.pages[0].extract_text() or "").translate(RADICALS)
+    m = re.search(ERA_DATE_RE.pattern + r'\s*現在', text)
+    return era_date(m.group(0)).strftime("%Y-%m-%d") if m else ""
+
+
+def extract_kinyushohin_pdf(pdf_path: str) -> list[dict]:
+    print(f"読み込み中: {pdf_path}")
+    companies = kinyushohin_records(iter_pdf_rows(pdf_path))
+    print(f"  → {len(companies)} 件")
+    return companies
+
+
+# ============================================================
+# Excel 版との突き合わせ
+# ============================================================
+def comparable(value: str) -> str:
+    return RECONCILE_IGNORE.sub("", str(value or "")).translate(RADICALS)
+
+
+def reconcile(pdf_records: list[dict], xlsx_records: list[dict]) -> dict:
+    """登録番号をキーに、片方にしかない業者と項目の食い違いを挙げる"""
+    pdf_by  = {record_key(e): e for e in pdf_records}
+    xlsx_by = {record_key(e): e for e in xlsx_records}
+
+    def brief(e: dict) -> dict:
+        return {"reg_key": record_key(e), "name": e["name"], "reg_no": e["reg_no"]}
+
+    diffs = []
+    for key in pdf_by.keys() & xlsx_by.keys():
+        p, x = pdf_by[key], xlsx_by[key]
+        fields = {f: [p.get(f, ""), x.get(f, "")] for f in RECONCILE_FIELDS
+                  if comparable(p.get(f, "")) != comparable(x.get(f, ""))}
+        if fields:
+            diffs.append({**brief(x), "fields": fields})
+
+    return {
+        "pdf_count":  len(pdf_records),
+        "xlsx_count": len(xlsx_records),
+        "matched":    len(pdf_by.keys() & xlsx_by.keys()) - len(diffs),
+        "only_pdf":   [brief(pdf_by[k])  for k in sorted(pdf_by.keys() - xlsx_by.keys())],
+        "only_xlsx":  [brief(xlsx_by[k]) for k in sorted(xlsx_by.keys() - pdf_by.keys())],
+        "diffs":      sorted(diffs, key=lambda d: d["reg_key"]),
+    }
+
+
+def write_reconcile(report: dict) -> None:
+    with open(RECONCILE_PATH, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+
+    print(f"\n突き合わせ: {RECONCILE_PATH}")
+    print(f"  一致:           {report['matched']} 件")
+    print(f"  PDF のみ:       {len(report['only_pdf'])} 件")
+    print(f"  Excel のみ:     {len(report['only_xlsx'])} 件")
+    print(f"  項目の食い違い: {len(report['diffs'])} 件")
+    for d in report["diffs"][:10]:
+        print(f"    {d['name']} [{d['reg_no']}]: {', '.join(d['fields'])}")
+
+
+def main():
+    if not Path(PDF_PATH).exists():
+        print(f"{PDF_PATH} が見つかりません")
+        sys.exit(1)
+
+    companies = extract_kinyushohin_pdf(PDF_PATH)
+    output = {
+        "generated":   pdf_as_of(PDF_PATH) or datetime.now().strftime("%Y-%m-%d"),
+        "source":      PDF_PATH,
+        "count":       len(companies),
+        "kinyushohin": companies,
+    }
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        json.dump(output, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"\n完了: {OUTPUT_PATH} に保存（{output['generated']} 現在、{len(companies)} 件）")
+
+    if not Path(XLSX_PATH).exists():
+        print(f"突き合わせをスキップ（ファイルなし）: {XLSX_PATH}")
+        return
+
+    write_reconcile(reconcile(companies, extract_kinyushohin(XLSX_PATH)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+金融庁 登録業者一覧 スナップショット履歴
+
+抽出のたびに fsa_all.json の内容を履歴ファイル（fsa_history.json.gz）へ追記し、
+「日付 D の時点で業者 X は登録されていたか」を、過去の JSON を読み直さずに答える。
+
+業者は登録番号ごとに「版」の列として持つ。各版には前の版から変わった項目だけを保存し、
+登録の有効期間（登録年月日 〜 一覧から消えたスナップショット）を区間として索引する。
+
+使い方:
+  python fsa_history.py add fsa_all.json               # スナップショットを追記（日付順に）
+  python fsa_history.py query "〇〇証券" 2025-04-01      # 社名または登録番号で時点照会
+
+注意:
+  - 一覧から消えた正確な日は分からない。最後に掲載されていたスナップショット（last_seen）と
+    初めて消えていたスナップショットの間のどこかで登録が抹消されている。
+  - 最初のスナップショットより前は、登録年月日から継続して登録されていたとみなす。
+"""
+
+import gzip
+import json
+import sys
+from bisect import bisect_right
+
+from fsa_lookup import CATEGORIES, entry_reg_key, iso_date, normalize, parse_reg_no, reg_key
+
+HISTORY_PATH = "fsa_history.json.gz"
+# リスト種別 → 登録番号の種別（extract_all_fsa.py の reg_fields に渡すものと同じ）
+REG_KINDS = {"金融商品取引業者": "金商", "金融商品仲介業者": "金仲", "登録金融機関": "登金"}
+
+
+def kind_for(category: str) -> str:
+    return REG_KINDS.get(category, "")
+
+
+def record_key(entry: dict, bureau: str = "") -> str:
+    """
+    業者の履歴のキー（財務局/種別/番号）。登録番号を分解する前の古い fsa_all.json には
+    reg_num が無いので、reg_no の文字列から同じキーを作る。番号だけの行は bureau で補う。
+    """
+    key = entry_reg_key(entry)
+    if key:
+        return key
+    parsed = parse_reg_no(entry.get("reg_no", ""), bureau, kind_for(entry.get("category", "")))
+    return reg_key(*parsed) if parsed else entry.get("reg_no", "")
+
+
+def load_history(path: str = HISTORY_PATH) -> dict:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"snapshots": [], "records": {}}
+
+
+def save_history(history: dict, path: str = HISTORY_PATH) -> None:
+    # mtime=0 で同じ内容なら同じバイト列になるようにする
+    with gzip.GzipFile(path, "wb", mtime=0) as gz:
+        gz.write(json.dumps(history, ensure_ascii=False, separators=(',', ':')).encode("utf-8"))
+
+
+def fields_of(versions: list[dict], upto: int | None = None) -> dict:
+    """版 0..upto の差分を順に適用した項目（upto 省略時は最新版）"""
+    fields: dict = {}
+    for v in versions[:None if upto is None else upto + 1]:
+        fields.update(v["d"])
+    return {k: val for k, val in fields.items() if val is not None}
+
+
+def diff_fields(prev: dict, cur: dict) -> dict:
+    delta = {k: v for k, v in cur.items() if prev.get(k) != v}
+    delta.update({k: None for k in prev if k not in cur})
+    return delta
+
+
+def append_snapshot(history: dict, date: str, entries: list[dict]) -> dict[str, int]:
+    """
+    date 時点の全件を履歴に追記する。変化の無い業者には何も書き足さない。
+    戻り値は 新規・変更・抹消 の件数。
+    """
+    snapshots = history["snapshots"]
+    if snapshots and date <= snapshots[-1]:
+        raise ValueError(f"{date} は最新のスナップショット {snapshots[-1]} 以前です（日付順に追記してください）")
+
+    records = history["records"]
+    stats = {"added": 0, "changed": 0, "removed": 0}
+    seen = set()
+    # 古い fsa_all.json の番号だけの行は、一覧の並び（所管ごと）で直前の行と同じ財務局とみなす
+    bureau: dict[str, str] = {}
+
+    for e in entries:
+        category = e.get("category", "")
+        key = record_key(e, bureau.get(category, ""))
+        if "/" in key:
+            bureau[category] = key.partition("/")[0]
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        versions = records.setdefault(key, [])
+        current = bool(versions) and versions[-1]["to"] is None
+        delta = diff_fields(fields_of(versions), e)
+        if current and not delta:
+            continue
+        if current:
+            versions[-1]["to"] = date
+            stats["changed"] += 1
+        else:
+            stats["added"] += 1
+        versions.append({"from": date, "to": None, "removed": False, "d": delta})
+
+    for key, versions in records.items():
+        last = versions[-1]
+        if last["to"] is None and key not in seen:
+            last["to"] = date
+            last["removed"] = True
+            stats["removed"] += 1
+
+    snapshots.append(date)
+    return stats
+
+
+class History:
+    """履歴ファイルを一度読み込み、時点照会に答える。照会は登録番号・社名の辞書引きと二分探索のみ"""
+
+    def __init__(self, history: dict):
+        self.snapshots = history["snapshots"]
+        self.records   = history["records"]
+        self.by_name: dict[str, set[str]] = {}
+        # key → 有効期間 [(開始日, 終了日 or None)]（開始日の昇順）
+        self.intervals: dict[str, list[tuple[str, str | None]]] = {}
+        for key, versions in self.records.items():
+            self.intervals[key] = self._validity(versions)
+            for i in range(len(versions)):
+                name_n = versions[i]["d"].get("name_n")
+                if name_n:
+                    self.by_name.setdefault(name_n, set()).add(key)
+
+    @classmethod
+    def load(cls, path: str = HISTORY_PATH) -> "History":
+        return cls(load_history(path))
+
+    @staticmethod
+    def _validity(versions: list[dict]) -> list[tuple[str, str | None]]:
+        intervals = []
+        start = None
+        for i, v in enumerate(versions):
+            if start is None:
+                # 再登録の場合、前回の抹消より前の登録年月日は使わない
+                prev_end = intervals[-1][1] if intervals else ""
+                # 古いスナップショットには和暦のままの登録年月日があるので揃えてから比べる
+                reg_date = iso_date(fields_of(versions, i).get("reg_date", ""))
+                start = reg_date if reg_date and prev_end <= reg_date <= v["from"] else v["from"]
+            if v["removed"] or v["to"] is None:
+                intervals.append((start, v["to"] if v["removed"] else None))
+                start = None
+        return intervals
+
+    def keys_for(self, query: str) -> list[str]:
+        """登録番号として読めればその番号、そうでなければ社名（正規化後の完全一致）で探す"""
+        parsed = parse_reg_no(query)
+        if parsed:
+            key = reg_key(*parsed)
+            return [key] if key in self.records else []
+        return sorted(self.by_name.get(normalize(query), ()))
+
+    def registered_on(self, query: str, date: str) -> list[dict]:
+        results = []
+        for key in self.keys_for(query):
+            intervals = self.intervals[key]
+            i = bisect_right([s for s, _ in intervals], date) - 1
+            hit = i >= 0 and (intervals[i][1] is None or date < intervals[i][1])
+            versions = self.records[key]
+            results.append({
+                "reg_key":    key,
+                "name":       fields_of(versions).get("name", ""),
+                "registered": hit,
+                "interval":   intervals[i] if i >= 0 else None,
+                "last_seen":  self._last_seen(versions),
+            })
+        return results
+
+    def _last_seen(self, versions: list[dict]) -> str | None:
+        last = versions[-1]
+        if last["to"] is None:
+            return self.snapshots[-1]
+        i = bisect_right(self.snapshots, last["to"]) - 2
+        return self.snapshots[i] if i >= 0 else None
+
+    def state_at(self, date: str) -> list[dict]:
+        """date 時点で登録されていた業者の項目（その時点の版）"""
+        out = []
+        for key, intervals in self.intervals.items():
+            i = bisect_right([s for s, _ in intervals], date) - 1
+            if i < 0 or (intervals[i][1] is not None and date >= intervals[i][1]):
+                continue
+            versions = self.records[key]
+            j = max((n for n, v in enumerate(versions) if v["from"] <= date), default=0)
+            out.append(fields_of(versions, j))
+        return out
+
+
+def main():
+    sys.stdout.reconfigure(encoding="utf-8")
+    if len(sys.argv) >= 3 and sys.argv[1] == "add":
+        history = load_history()
+        for path in sys.argv[2:]:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            entries = [e for key in CATEGORIES for e in data.get(key, [])]
+            # as_of（一覧の作成日）の無い古いファイルは生成日で代用する
+            date = data.get("as_of") or data["generated"]
+            stats = append_snapshot(history, date, entries)
+            print(f"{path} ({date}): 新規 {stats['added']} / 変更 {stats['changed']}"
+                  f" / 抹消 {stats['removed']}")
+        save_history(history)
+        print(f"完了: {HISTORY_PATH}（スナップショット {len(history['snapshots'])} 回分）")
+    elif len(sys.argv) == 4 and sys.argv[1] == "query":
+        results = History.load().registered_on(sys.argv[2], sys.argv[3])
+        if not results:
+            print("履歴に該当する業者がありません")
+        for r in results:
+            status = "登録あり" if r["registered"] else "登録なし"
+            print(f"{r['name']} [{r['reg_key']}] {sys.argv[3]} 時点: {status}"
+                  f"（有効期間 {r['interval']}、最終掲載 {r['last_seen']}）")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,585 @@
+"""
+金融庁 登録業者データ 索引・照会ライブラリ
+
+fsa_all.json から検索用の索引を作る。build_checker.py が checker.html に
+埋め込む索引もここで生成するため、Python 側と画面側の判定は一致する。
+openpyxl は不要（抽出スクリプトとは独立して import できる）。
+
+使い方:
+  from fsa_lookup import FsaIndex, load_prefilter, definitely_unregistered
+  pf = load_prefilter()
+  definitely_unregistered("〇〇投資顧問株式会社", pf)  # True なら確実に未登録
+
+  idx = FsaIndex.load()
+  idx.find_reg_no("関東財務局長（金商）第16号")        # 登録番号 → 業者
+  idx.find_corp_no("4010401061149")                    # 法人番号 → 業者
+  idx.find_phone("03-5447-3100（代表）")               # 電話番号 → 業者
+  idx.parents(entry) / idx.members(entry)              # 仲介業者 ⇔ 所属金融商品取引業者等
+  idx.filter(business="投資助言・代理業", bureau="近畿財務局", pref="大阪府")
+  idx.facet_counts(pref="大阪府")                      # 条件ごとの件数
+  idx.search("〇〇投資顧問", "東京都港区")              # 社名検索（登録・警告を 1 回の走査で）
+  idx.verdict("〇〇投資顧問")                          # → ("alert" | "safe" | "warning" | "danger", 業者)
+"""
+
+import base64
+import json
+import math
+import re
+from collections import Counter
+from datetime import datetime
+
+ALL_JSON   = "fsa_all.json"
+ARROW_PATH = "fsa_all.arrow"
+QUERY_LOG  = "query_log.tsv"   # 匿名化した検索ログ（1 行 1 検索: 社名<TAB>住所）
+HOT_QUERIES = 200              # 判定を事前計算して埋め込む頻出クエリの数
+CATEGORIES = ("kinyushohin", "chuukai", "touroku")
+# 金融庁の警告を受けた無登録業者（登録ではないので CATEGORIES には含めない）
+WARNING_LIST     = "mutouroku"
+WARNING_CATEGORY = "無登録警告業者"
+
+ZEN_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+
+
+def normalize(text: str) -> str:
+    """会社名・住所を比較しやすい形に正規化する（extract_all_fsa.py と同一）"""
+    if not text:
+        return ""
+    text = str(text)
+    text = text.translate(str.maketrans(
+        "ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ"
+        "ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ"
+        "０１２３４５６７８９",
+        "abcdefghijklmnopqrstuvwxyz"
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        "0123456789"
+    ))
+    text = re.sub(
+        r'株式会社|有限会社|合同会社|合資会社|合名会社|一般社団法人|一般財団法人'
+        r'|\(株\)|\(有\)|（株）|（有）', '', text
+    )
+    text = re.sub(r'[\s\u3000]+', '', text)
+    return text.lower()
+
+
+def load_entries(path: str = ALL_JSON, warnings: bool = True) -> list[dict]:
+    """
+    fsa_all.json を checker.html の DB と同じ順序（取引業者→仲介業者→登録金融機関→警告業者）で返す。
+    warnings=False なら 3 つの登録リストだけ。
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    keys = CATEGORIES + (WARNING_LIST,) if warnings else CATEGORIES
+    return [e for key in keys for e in data.get(key, [])]
+
+
+def is_warning(entry: dict) -> bool:
+    return entry.get("category") == WARNING_CATEGORY
+
+
+def load_table(path: str = ARROW_PATH):
+    """
+    extract_all_fsa.py が書き出した fsa_all.arrow をメモリマップで開き pyarrow.Table を返す。
+    列データはファイルから直接参照されるため開くコストはほぼ無く、同じファイルを開いた
+    プロセス間ではページキャッシュが共有される。pandas へは .to_pandas() で変換する。
+    """
+    import pyarrow as pa
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+# ============================================================
+# 日付（一覧の登録年月日には和暦の文字列が混ざる）
+# ============================================================
+ERAS = {"令和": 2018, "平成": 1988, "昭和": 1925}
+ERA_DATE_RE = re.compile(r'(令和|平成|昭和)\s*(元|\d+)\s*年\s*(\d+)\s*月\s*(\d+)\s*日')
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def era_date(text: str):
+    """「平成19年9月30日」→ datetime。和暦でなければそのまま返す"""
+    m = ERA_DATE_RE.search(text or "")
+    if not m:
+        return text
+    era, year, month, day = m.groups()
+    year = 1 if year == "元" else int(year)
+    return datetime(ERAS[era] + year, int(month), int(day))
+
+
+def iso_date(text: str) -> str:
+    """「2019-06-24」「令和元年6月24日」→ "2019-06-24"。日付として読めなければ空文字"""
+    text = str(text or "").strip()
+    try:
+        if ISO_DATE_RE.fullmatch(text):
+            return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d")
+        d = era_date(text)
+    except ValueError:
+        return ""
+    return d.strftime("%Y-%m-%d") if isinstance(d, datetime) else ""
+
+
+# ============================================================
+# Bloom フィルタ（「確実に未登録」の事前判定）
+# ============================================================
+# ハッシュは JS 側（checker.html）と同じく UTF-16 コード単位の FNV-1a。
+# 2 つのハッシュ値から k 個の位置を作る（double hashing）。
+FNV_OFFSET = 0x811C9DC5
+FNV_PRIME  = 0x01000193
+FNV_SEED2  = 0x9E3779B9
+
+GRAM_N       = 3       # n-gram の長さ（2 だと頻出語の組合せで大半が素通りする）
+GRAM_FP_RATE = 0.01    # 会社名 n-gram 用（1 つでも不在なら未登録と判定できる）
+NAME_FP_RATE = 0.001   # 会社名全体用（入力の部分文字列を全て照会するため低めに）
+
+
+def fnv1a(text: str, seed: int = FNV_OFFSET) -> int:
+    h = seed
+    data = text.encode("utf-16-le")
+    for i in range(0, len(data), 2):
+        h ^= data[i] | (data[i + 1] << 8)
+        h = (h * FNV_PRIME) & 0xFFFFFFFF
+    return h
+
+
+class BloomFilter:
+    """偽陽性はあるが偽陰性のない集合。to_dict() の形で checker.html に埋め込む"""
+
+    def __init__(self, m: int, k: int, bits: bytearray | None = None):
+        self.m = m
+        self.k = k
+        self.bits = bits if bits is not None else bytearray((m + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, n: int, fp_rate: float) -> "BloomFilter":
+        n = max(n, 1)
+        m = math.ceil(-n * math.log(fp_rate) / math.log(2) ** 2)
+        m = (m + 7) // 8 * 8
+        k = max(1, round(m / n * math.log(2)))
+        return cls(m, k)
+
+    def _positions(self, key: str):
+        h1 = fnv1a(key)
+        h2 = fnv1a(key, FNV_OFFSET ^ FNV_SEED2) | 1
+        for i in range(self.k):
+            yield ((h1 + i * h2) & 0xFFFFFFFF) % self.m
+
+    def add(self, key: str) -> None:
+        for p in self._positions(key):
+            self.bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def to_dict(self) -> dict:
+        return {"m": self.m, "k": self.k,
+                "bits": base64.b64encode(bytes(self.bits)).decode("ascii")}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "BloomFilter":
+        return cls(d["m"], d["k"], bytearray(base64.b64decode(d["bits"])))
+
+
+def ngrams(text: str, n: int = GRAM_N) -> list[str]:
+    # 単位はコードポイント。checker.html 側も Array.from() で同じ単位に分ける
+    #（JS の slice は UTF-16 単位なので、𣘺 などのサロゲートペアで gram がずれる）
+    return [text[i:i + n] for i in range(len(text) - n + 1)]
+
+
+def build_prefilter(entries: list[dict]) -> dict:
+    """
+    全件の name_n から事前判定用フィルタ（gram / name の 2 本）を作る。
+    警告業者も含めるので、警告業者名が「確実に未登録」で素通りすることはない。
+    """
+    names = {e["name_n"] for e in entries if e.get("name_n")}
+    grams = {g for n in names for g in ngrams(n)}
+
+    gram_filter = BloomFilter.for_capacity(len(grams), GRAM_FP_RATE)
+    for g in grams:
+        gram_filter.add(g)
+    name_filter = BloomFilter.for_capacity(len(names), NAME_FP_RATE)
+    for n in names:
+        name_filter.add(n)
+
+    return {"gram": gram_filter.to_dict(), "name": name_filter.to_dict()}
+
+
+def load_prefilter(path: str = ALL_JSON) -> dict:
+    pf = build_prefilter(load_entries(path))
+    return {key: BloomFilter.from_dict(d) for key, d in pf.items()}
+
+
+def definitely_unregistered(name: str, prefilter: dict) -> bool:
+    """
+    checker.html の searchDB() で 1 件もヒットしないことが確実なら True。
+    searchDB() は「登録名が入力を含む」「入力が登録名を含む」の双方向部分一致なので、
+      - 入力の n-gram が 1 つでもフィルタに無ければ前者は起こらない
+      - 入力のどの部分文字列も登録名フィルタに無ければ後者も起こらない
+    False は「登録の可能性あり」で、正確な判定は全件検索に任せる。
+    """
+    name_n = normalize(name)
+    if not name_n:
+        return False
+    gram_filter, name_filter = prefilter["gram"], prefilter["name"]
+    if all(g in gram_filter for g in ngrams(name_n)):
+        return False
+    for i in range(len(name_n)):
+        for j in range(i + 1, len(name_n) + 1):
+            if name_n[i:j] in name_filter:
+                return False
+    return True
+
+
+# ============================================================
+# 登録番号・法人番号
+# ============================================================
+# 例: 関東財務局長(金商)第16号 / 福岡財務支局長（登金）第 5 号
+REG_NO_RE = re.compile(
+    r'^(?P<bureau>.*?(?:財務局|財務支局|総合事務局))長?'
+    r'[（(](?P<kind>[^)）]+)[)）]第?(?P<num>\d+)号?$'
+)
+
+
+def parse_reg_no(text: str, bureau: str = "", kind: str = "") -> tuple[str, str, int] | None:
+    """
+    登録番号を (財務局, 種別, 番号) に分解する。
+    Excel には番号だけの行があるため、bureau / kind を渡すとその行の既定値として使う。
+    """
+    s = re.sub(r'[\s\u3000]+', '', str(text or "")).translate(ZEN_DIGITS)
+    if not s:
+        return None
+    if s.isdigit():
+        return (bureau, kind, int(s)) if bureau and kind else None
+    m = REG_NO_RE.match(s)
+    if not m:
+        return None
+    return (m["bureau"], m["kind"], int(m["num"]))
+
+
+def reg_key(bureau: str, kind: str, num: int) -> str:
+    return f"{bureau}/{kind}/{num}"
+
+
+def corp_no_check_digit(base12: str) -> int:
+    """法人番号の検査用数字（下位桁から奇数桁×1・偶数桁×2 の和を 9 で割った余りを 9 から引く）"""
+    total = sum(int(d) * (1 if i % 2 == 0 else 2) for i, d in enumerate(reversed(base12)))
+    return 9 - total % 9
+
+
+def clean_corp_no(value) -> str:
+    """法人番号を 13 桁の文字列にする。未記入（「－」等）や検査用数字の不一致は空文字"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    s = re.sub(r'[\s\u3000\-－]+', '', str(value or "")).translate(ZEN_DIGITS)
+    if len(s) != 13 or not s.isdigit():
+        return ""
+    return s if corp_no_check_digit(s[1:]) == int(s[0]) else ""
+
+
+# ============================================================
+# 電話番号
+# ============================================================
+def normalize_phone(text: str) -> str:
+    """
+    電話番号を数字だけの形にする（ハイフン・括弧・空白・全角数字・「代表」等の注記を除去）。
+    国際表記は +81 を国内の 0 始まりに直し、それ以外の国番号は + を残す。
+    """
+    s = str(text or "").translate(ZEN_DIGITS).replace("＋", "+")
+    s = re.split(r'内線|ext\.?', s, flags=re.IGNORECASE)[0]
+    s = re.sub(r'[（(]?(?:代表|直通)[)）]?|TEL[:：]?|電話[:：]?', '', s, flags=re.IGNORECASE).strip()
+    digits = re.sub(r'\D', '', s)
+    if s.startswith("+"):
+        if digits.startswith("81"):
+            digits = digits[2:] if digits[2:3] == "0" else "0" + digits[2:]
+        else:
+            digits = "+" + digits
+    elif digits.startswith("010"):     # 国際電話の発信番号
+        digits = "+" + digits[3:]
+    return digits if len(digits.lstrip("+")) >= 6 else ""
+
+
+def entry_reg_key(entry: dict) -> str:
+    if not entry.get("reg_num"):
+        return ""
+    return reg_key(entry["reg_bureau"], entry["reg_kind"], entry["reg_num"])
+
+
+def entry_corp_no(entry: dict) -> str:
+    return entry.get("corp_no", "")
+
+
+def entry_phone(entry: dict) -> str | list[str]:
+    # 警告業者は併記された全番号のリスト
+    return entry.get("phone_n", "")
+
+
+# ============================================================
+# 仲介業者 ⇔ 所属金融商品取引業者等
+# ============================================================
+PARENT_CATEGORIES = ("金融商品取引業者", "登録金融機関")
+
+
+def split_belongs(text: str) -> list[str]:
+    return [b.strip() for b in str(text or "").split(" / ") if b.strip()]
+
+
+def resolve_parent(name_n: str, by_name: dict[str, list[int]]) -> list[int]:
+    """所属先の社名を通し番号に解決する。完全一致が無ければ部分一致で 1 社に絞れた場合のみ採用"""
+    if name_n in by_name:
+        return by_name[name_n]
+    cands = [n for n in by_name if n in name_n or name_n in n]
+    return by_name[cands[0]] if len(cands) == 1 else []
+
+
+def to_csr(edges: list[tuple[int, int]], n: int) -> dict:
+    """(始点, 終点) の一覧を CSR 形式に。始点 i の隣接先は adj[off[i]:off[i+1]]"""
+    adj_lists: list[list[int]] = [[] for _ in range(n)]
+    for a, b in edges:
+        if b not in adj_lists[a]:
+            adj_lists[a].append(b)
+    off = [0]
+    for lst in adj_lists:
+        off.append(off[-1] + len(lst))
+    return {"off": off, "adj": [b for lst in adj_lists for b in lst]}
+
+
+def csr_neighbors(csr: dict, i: int) -> list[int]:
+    return csr["adj"][csr["off"][i]:csr["off"][i + 1]]
+
+
+def build_belongs_join(entries: list[dict]) -> dict:
+    """
+    仲介業者の belongs を取引業者・登録金融機関の通し番号に一度だけ解決し、
+    parents（仲介業者 → 所属先）と members（所属先 → 仲介業者）の隣接リストを返す。
+    """
+    by_name: dict[str, list[int]] = {}
+    for i, e in enumerate(entries):
+        if e.get("category") in PARENT_CATEGORIES:
+            by_name.setdefault(e["name_n"], []).append(i)
+
+    edges = [
+        (i, j)
+        for i, e in enumerate(entries)
+        for b in split_belongs(e.get("belongs"))
+        for j in resolve_parent(normalize(b), by_name)
+    ]
+    return {
+        "parents": to_csr(edges, len(entries)),
+        "members": to_csr([(j, i) for i, j in edges], len(entries)),
+    }
+
+
+# ============================================================
+# 絞り込み（業務種別・リスト・財務局・都道府県のビットセット）
+# ============================================================
+BUSINESS_TYPES = {
+    "type1":    "第一種金融商品取引業",
+    "type2":    "第二種金融商品取引業",
+    "advisory": "投資助言・代理業",
+    "mgmt":     "投資運用業",
+}
+FACETS = ("category", "business", "bureau", "pref")
+
+PREF_RE = re.compile(r'^(北海道|東京都|京都府|大阪府|.{2,3}?県)')
+# 都道府県を省いて書かれた住所用（政令指定都市）
+CITY_PREF = {
+    "札幌市": "北海道", "仙台市": "宮城県", "さいたま市": "埼玉県", "千葉市": "千葉県",
+    "横浜市": "神奈川県", "川崎市": "神奈川県", "相模原市": "神奈川県", "新潟市": "新潟県",
+    "静岡市": "静岡県", "浜松市": "静岡県", "名古屋市": "愛知県", "京都市": "京都府",
+    "大阪市": "大阪府", "堺市": "大阪府", "神戸市": "兵庫県", "岡山市": "岡山県",
+    "広島市": "広島県", "北九州市": "福岡県", "福岡市": "福岡県", "熊本市": "熊本県",
+}
+
+
+def prefecture(address: str) -> str:
+    """住所の都道府県。判別できない住所（海外等）は「その他」"""
+    address = str(address or "").strip()
+    m = PREF_RE.match(address)
+    if m:
+        return m.group(1)
+    for city, pref in CITY_PREF.items():
+        if address.startswith(city):
+            return pref
+    return "その他"
+
+
+def entry_facets(entry: dict) -> dict[str, list[str]]:
+    # 警告業者は種別（無登録警告業者）でだけ選べるようにし、業務・財務局・所在地で
+    # 絞った一覧に登録業者と並んで出ないようにする
+    if is_warning(entry):
+        return {"category": [entry["category"]]}
+    return {
+        "category": [entry.get("category", "")],
+        "business": [label for key, label in BUSINESS_TYPES.items() if "○" in (entry.get(key) or "")],
+        "bureau":   [entry.get("reg_bureau", "")],
+        "pref":     [prefecture(entry.get("address"))],
+    }
+
+
+def build_facets(entries: list[dict]) -> dict[str, dict[str, int]]:
+    """facet → 値 → 該当する通し番号のビットセット（Python の int、ビット i が DB[i]）"""
+    facets: dict[str, dict[str, int]] = {f: {} for f in FACETS}
+    for i, e in enumerate(entries):
+        for facet, values in entry_facets(e).items():
+            for v in values:
+                if v:
+                    facets[facet][v] = facets[facet].get(v, 0) | (1 << i)
+    for facet in FACETS:
+        facets[facet] = dict(sorted(facets[facet].items(), key=lambda kv: -kv[1].bit_count()))
+    return facets
+
+
+def encode_bitset(bits: int, n: int) -> str:
+    """ビット i をバイト i>>3 の i&7 ビット目に置いたリトルエンディアン列の base64"""
+    return base64.b64encode(bits.to_bytes((n + 31) // 32 * 4, "little")).decode("ascii")
+
+
+def build_key_index(entries: list[dict], key_fn) -> dict[str, list[int]]:
+    """
+    key_fn(entry) → 通し番号（DB 配列の添字）の一覧。空キーは載せない。
+    key_fn はキーのリストを返してもよく、その場合はどのキーからも同じ業者を引ける。
+    """
+    index: dict[str, list[int]] = {}
+    for i, e in enumerate(entries):
+        keys = key_fn(e)
+        for key in dict.fromkeys([keys] if isinstance(keys, str) else keys):
+            if key:
+                index.setdefault(key, []).append(i)
+    return index
+
+
+class FsaIndex:
+    """fsa_all.json 全件（警告業者を含む）と完全一致索引。構築は一度だけ O(n)、番号の照会は O(1)"""
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        # entry → 通し番号。登録番号は警告業者に無く、一意とも限らないので逆引きには使わない
+        self._positions = {id(e): i for i, e in enumerate(entries)}
+        self.by_reg  = build_key_index(entries, entry_reg_key)
+        self.by_corp = build_key_index(entries, entry_corp_no)
+        self.by_phone = build_key_index(entries, entry_phone)
+        self.join    = build_belongs_join(entries)
+        self.facets  = build_facets(entries)
+
+    @classmethod
+    def load(cls, path: str = ALL_JSON) -> "FsaIndex":
+        return cls(load_entries(path))
+
+    def search(self, name: str, address: str = "") -> dict[str, list[dict]]:
+        """
+        checker.html の searchDB() と同じ双方向部分一致で全件を 1 回だけ走査する。
+        登録業者は住所も一致すれば matched、社名だけなら partial、警告業者は warned に入る。
+        """
+        name_n, addr_n = normalize(name), normalize(address)
+        result: dict[str, list[dict]] = {"matched": [], "partial": [], "warned": []}
+        if not name_n:
+            return result
+        for e in self.entries:
+            if name_n not in e["name_n"] and e["name_n"] not in name_n:
+                continue
+            if is_warning(e):
+                result["warned"].append(e)
+            elif len(addr_n) >= 3 and addr_n not in e["addr_n"] and e["addr_n"] not in addr_n:
+                result["partial"].append(e)
+            else:
+                result["matched"].append(e)
+        return result
+
+    def verdict(self, name: str, address: str = "") -> tuple[str, dict | None]:
+        """
+        checker.html の doSearch() と同じ判定。社名が警告業者と完全に一致し（正規化後）、
+        同名の登録業者が無ければ "alert"。以下 "safe" / "warning" / "danger" の順。
+        """
+        name_n = normalize(name)
+        hits = self.search(name, address)
+        confirmed = [e for e in hits["warned"] if e["name_n"] == name_n]
+        registered = hits["matched"] + hits["partial"]
+        if confirmed and not any(e["name_n"] == name_n for e in registered):
+            return "alert", confirmed[0]
+        if hits["matched"]:
+            return "safe", hits["matched"][0]
+        if hits["partial"]:
+            return "warning", hits["partial"][0]
+        return "danger", None
+
+    def _get(self, index: dict, key: str) -> list[dict]:
+        return [self.entries[i] for i in index.get(key, [])] if key else []
+
+    def find_reg_no(self, text: str) -> list[dict]:
+        parsed = parse_reg_no(text)
+        return self._get(self.by_reg, reg_key(*parsed)) if parsed else []
+
+    def find_corp_no(self, text: str) -> list[dict]:
+        return self._get(self.by_corp, clean_corp_no(text))
+
+    def find_phone(self, text: str) -> list[dict]:
+        return self._get(self.by_phone, normalize_phone(text))
+
+    def position(self, entry: dict) -> int:
+        """self.entries 内の通し番号（checker.html の DB 配列の添字と同じ）"""
+        return self._positions[id(entry)]
+
+    def parents(self, entry: dict) -> list[dict]:
+        """仲介業者 → 所属金融商品取引業者等"""
+        return [self.entries[j] for j in csr_neighbors(self.join["parents"], self.position(entry))]
+
+    def members(self, entry: dict) -> list[dict]:
+        """金融商品取引業者・登録金融機関 → 所属する仲介業者"""
+        return [self.entries[j] for j in csr_neighbors(self.join["members"], self.position(entry))]
+
+    def _mask(self, selected: dict[str, str], skip: str = "") -> int:
+        mask = (1 << len(self.entries)) - 1
+        for facet, value in selected.items():
+            if facet not in FACETS:
+                raise ValueError(f"未知の絞り込み条件: {facet}")
+            if value and facet != skip:
+                mask &= self.facets[facet].get(value, 0)
+        return mask
+
+    def filter(self, **selected: str) -> list[dict]:
+        """例: filter(business="投資助言・代理業", bureau="近畿財務局", pref="大阪府")"""
+        mask = self._mask(selected)
+        return [e for i, e in enumerate(self.entries) if mask >> i & 1]
+
+    def facet_counts(self, **selected: str) -> dict[str, dict[str, int]]:
+        """各条件の値ごとの件数。自分以外の条件で絞り込んだ上で数える"""
+        return {
+            facet: {v: (bits & self._mask(selected, skip=facet)).bit_count()
+                    for v, bits in values.items()}
+            for facet, values in self.facets.items()
+        }
+
+
+# ============================================================
+# 頻出クエリの判定表（checker.html の検索結果キャッシュの 2 段目）
+# ============================================================
+def query_key(name: str, address: str = "") -> str:
+    """キャッシュのキー。checker.html の cacheKey() と同じ"""
+    return normalize(name) + "\t" + normalize(address)
+
+
+def load_query_log(path: str = QUERY_LOG) -> Counter:
+    """
+    匿名化した検索ログを読み、キーごとの検索回数を返す。ファイルが無ければ空。
+    ログには入力された社名と住所だけを残し、利用者を特定できる情報は含めないこと。
+    """
+    counts: Counter = Counter()
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                name, _, address = line.rstrip("\r\n").partition("\t")
+                if normalize(name):
+                    counts[query_key(name, address)] += 1
+    except FileNotFoundError:
+        pass
+    return counts
+
+
+def build_hot_verdicts(index: FsaIndex, counts: Counter, top_n: int = HOT_QUERIES) -> dict[str, list]:
+    """
+    検索回数の多い top_n 件について verdict() を前もって計算する。
+    値は [判定, 通し番号]（該当業者が無い判定は -1）。キーは正規化済みなのでそのまま照会に使う。
+    """
+    table = {}
+    for key, _ in counts.most_common(top_n):
+        name_n, _, addr_n = key.partition("\t")
+        verdict, entry = index.verdict(name_n, addr_n)
+        table[key] = [verdict, index.position(entry) if entry is not None else -1]
+    return table
@@ -0,0 +1,129 @@
+"""
+金融庁 登録業者一覧 Python ライブラリ（常駐する照合処理向け）
+
+fsa_all.json を省メモリな形で保持する。
+  - 1 件は __slots__ の Record。dict より小さく、リスト種別・財務局・「○」のように
+    種類の少ない文字列は intern して全件で 1 つのオブジェクトを共有する
+  - 取引業者・仲介業者・登録金融機関はリストごとに、初めて参照された時に読み込む
+    （ファイル全体ではなく該当リストの部分だけを JSON として解釈する）
+openpyxl には依存しない。
+
+使い方:
+  from fsa_register import Register
+  reg = Register()
+  reg.kinyushohin[0].name        # ここで取引業者だけが読み込まれる
+  for r in reg: ...              # 3 リスト全件（DB と同じ順序）
+  idx = reg.index()              # fsa_lookup.FsaIndex（番号検索・絞り込み等）
+"""
+
+import json
+import mmap
+import re
+import sys
+
+from fsa_lookup import ALL_JSON, BUSINESS_TYPES, CATEGORIES, FsaIndex
+
+FIELDS = (
+    "category", "name", "name_n", "address", "addr_n",
+    "reg_no", "reg_bureau", "reg_kind", "reg_num", "reg_date", "corp_no",
+    "phone", "phone_n", "type1", "type2", "advisory", "mgmt",
+    "corp_type", "belongs",
+)
+# 値の種類が少なく、全件で共有できる項目
+INTERNED = ("category", "reg_bureau", "reg_kind", "type1", "type2", "advisory", "mgmt", "corp_type")
+
+SECTION_RE = re.compile(rb'"(%s)"\s*:\s*\[' % "|".join(CATEGORIES).encode())
+GENERATED_RE = re.compile(rb'"generated"\s*:\s*"([^"]*)"')
+
+
+class Record:
+    """登録業者 1 件。dict と同じく r["name"] / r.get("name") でも読める"""
+
+    __slots__ = FIELDS
+
+    def __init__(self, d: dict):
+        for f in FIELDS:
+            v = d.get(f)
+            if v is None:
+                v = None if f == "reg_num" else ""
+            elif f in INTERNED:
+                v = sys.intern(v)
+            setattr(self, f, v)
+
+    def __getitem__(self, key: str):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+    @property
+    def business_types(self) -> list[str]:
+        return [label for key, label in BUSINESS_TYPES.items() if "○" in getattr(self, key)]
+
+    def to_dict(self) -> dict:
+        return {f: getattr(self, f) for f in FIELDS}
+
+    def __repr__(self) -> str:
+        return f"Record({self.category}: {self.name} {self.reg_no})"
+
+
+class Register:
+    """fsa_all.json の 3 リスト。各リストは初回アクセス時に読み込んでキャッシュする"""
+
+    def __init__(self, path: str = ALL_JSON):
+        self.path = path
+        self._lists: dict[str, list[Record]] = {}
+        self._generated = None
+
+    def _read_section(self, key: str) -> list[dict]:
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            starts = {m.group(1).decode(): m.end() - 1 for m in SECTION_RE.finditer(mm)}
+            if key not in starts:
+                raise KeyError(f"{self.path} に {key} がありません")
+            # 次のリストの手前まで（無ければ末尾まで）を切り出し、先頭の配列だけを解釈する
+            end = min((s for s in starts.values() if s > starts[key]), default=len(mm))
+            text = mm[starts[key]:end].decode("utf-8")
+        section, _ = json.JSONDecoder().raw_decode(text)
+        return section
+
+    def category(self, key: str) -> list[Record]:
+        if key not in CATEGORIES:
+            raise KeyError(key)
+        if key not in self._lists:
+            self._lists[key] = [Record(d) for d in self._read_section(key)]
+        return self._lists[key]
+
+    @property
+    def kinyushohin(self) -> list[Record]:
+        return self.category("kinyushohin")
+
+    @property
+    def chuukai(self) -> list[Record]:
+        return self.category("chuukai")
+
+    @property
+    def touroku(self) -> list[Record]:
+        return self.category("touroku")
+
+    @property
+    def generated(self) -> str:
+        if self._generated is None:
+            with open(self.path, "rb") as f:
+                m = GENERATED_RE.search(f.read(512))
+            self._generated = m.group(1).decode() if m else ""
+        return self._generated
+
+    def all(self) -> list[Record]:
+        return [r for key in CATEGORIES for r in self.category(key)]
+
+    def __iter__(self):
+        for key in CATEGORIES:
+            yield from self.category(key)
+
+    def __len__(self) -> int:
+        return sum(len(self.category(key)) for key in CATEGORIES)
+
+    def index(self) -> FsaIndex:
+        return FsaIndex(self.all())
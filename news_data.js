@@ -0,0 +1,2 @@
+// build_news.py が news.json から生成（手で編集しないこと）
+const NEWS_DATA={"items":[{"id":1,"date":"2024-12","cat":"law","catLabel":"法規制・対策","source":"金融庁・警察庁","title":"政府が「投資詐欺撲滅プロジェクトチーム」を設置、SNS事業者への規制強化を検討","body":"急増するSNS型投資詐欺を受け、政府は関係省庁横断のプロジェクトチームを設置。SNSプラットフォームへの広告審査強化要請や、偽広告の迅速削除を義務付ける法整備の検討を開始した。","impact":"high","impactLabel":"重要","searchQuery":"投資詐欺 政府対策 2024"},{"id":2,"date":"2024-11","cat":"sns","catLabel":"SNS型","source":"警察庁","title":"著名実業家・芸能人の画像を悪用した偽広告による投資詐欺、摘発件数が過去最多に","body":"2024年に入り、FacebookやInstagram上で著名人の画像を無断使用した投資詐欺広告が急増。警察庁は特設窓口を開設し、同広告経由の被害者数・被害額が過去最多ペースで増加していると発表した。","impact":"high","impactLabel":"重要","searchQuery":"なりすまし広告 投資詐欺 2024"},{"id":3,"date":"2024-11","cat":"romance","catLabel":"ロマンス詐欺","source":"消費者庁","title":"マッチングアプリ起点のSNS型「ロマンス詐欺」相談件数が急増、20〜40代にも被害拡大","body":"消費者庁の調査で、マッチングアプリで知り合った相手に投資を勧められる「ロマンス詐欺」の相談が急増していることが判明。従来の高齢者中心から20〜40代の若年層にも被害が広がっている。","impact":"high","impactLabel":"重要","searchQuery":"ロマンス詐欺 マッチングアプリ 2024"},{"id":4,"date":"2024-10","cat":"law","catLabel":"法規制・対策","source":"金融庁","title":"金融庁が無登録業者リストを更新、SNS経由で勧誘する海外拠点の詐欺業者40社超を追加","body":"金融庁は無登録で金融商品取引業を行う疑いのある業者リストを更新し、SNS上で日本人投資家を勧誘している海外拠点の業者40社超を新たに掲載。投資前の業者確認を強く呼びかけた。","impact":"high","impactLabel":"重要","searchQuery":"金融庁 無登録業者 2024"},{"id":5,"date":"2024-10","cat":"crypto","catLabel":"仮想通貨","source":"警察庁・金融庁","title":"偽の暗号資産取引所サイトへ誘導する手口が増加、入金後に出金できなくなる被害が多発","body":"本物そっくりに作られた偽の暗号資産取引所サイトに誘導し、入金後は「税金」「手数料」などを名目に追加送金を繰り返し要求するフィッシング型の暗号資産詐欺が多発。金融庁が注意喚起を発出した。","impact":"high","impactLabel":"重要","searchQuery":"偽 仮想通貨取引所 詐欺 2024"},{"id":6,"date":"2024-09","cat":"ponzi","catLabel":"ポンジ・スキーム","source":"警視庁","title":"「高利回りFX自動売買ツール」名目の詐欺グループを摘発、被害者100名超・被害額数億円規模","body":"FX自動売買ツールへの投資を名目に出資を集め、実際には運用せず自転車操業で配当を払い続けていた詐欺グループが摘発された。SNSを通じて「月利20%保証」と謳い勧誘していた。","impact":"high","impactLabel":"重要","searchQuery":"FX自動売買 詐欺 摘発 2024"},{"id":7,"date":"2024-08","cat":"law","catLabel":"法規制・対策","source":"総務省・メタ社","title":"総務省がSNS大手に投資詐欺広告の迅速削除を要請、メタ社が対策強化を表明","body":"総務省は主要SNSプラットフォーム事業者に対し、詐欺的な投資広告の迅速削除と審査体制強化を要請。メタ社（Facebook/Instagram）はAIを活用した広告審査の強化と、なりすまし広告の報告窓口拡充を発表した。","impact":"medium","impactLabel":"注目","searchQuery":"総務省 SNS 投資詐欺広告 規制 2024"},{"id":8,"date":"2024-08","cat":"romance","catLabel":"ロマンス詐欺","source":"警察庁","title":"国際ロマンス詐欺グループを国際共同捜査で摘発、東南アジア拠点の組織的犯行","body":"SNS・マッチングアプリで日本人を標的にしていた国際ロマンス詐欺グループが、国際刑事警察機構（インターポール）との共同捜査で摘発された。東南アジアを拠点に複数国の市民を被害者とした組織的犯行だった。","impact":"medium","impactLabel":"注目","searchQuery":"国際ロマンス詐欺 摘発 国際共同捜査 2024"},{"id":9,"date":"2024-07","cat":"stock","catLabel":"未公開株・社債","source":"証券取引等監視委員会","title":"「上場前の優良株を特別提供」と偽る電話勧誘詐欺が再燃、証券監視委が注意喚起","body":"証券取引等監視委員会は、存在しない未公開株や価値のない株式を「もうすぐ上場する優良企業の株」と偽って高額で売りつける電話勧誘詐欺が再び増加しているとして、改めて注意喚起を行った。","impact":"medium","impactLabel":"注目","searchQuery":"未公開株 電話勧誘 詐欺 2024"},{"id":10,"date":"2024-07","cat":"sns","catLabel":"SNS型","source":"日本弁護士連合会","title":"著名人が顔画像の無断使用に対し法的措置、詐欺広告に実名使用の被害申告が相次ぐ","body":"投資詐欺広告に顔写真・名前を無断使用された著名人や実業家が、SNSプラットフォームおよび詐欺グループへの法的措置を進めていることが報じられた。日本弁護士連合会は被害申告の窓口整備を呼びかけた。","impact":"medium","impactLabel":"注目","searchQuery":"投資詐欺 著名人 なりすまし 法的措置 2024"},{"id":11,"date":"2024-06","cat":"crypto","catLabel":"仮想通貨","source":"金融庁","title":"「NFT・メタバース投資で確実に10倍」謳う詐欺が若年層を直撃、金融庁が警告","body":"NFTやメタバース関連プロジェクトへの投資名目で高額の暗号資産を詐取する被害が増加。「希少NFTを先行購入できる」などと謳い、若年層を中心に被害が拡大していると金融庁が警告した。","impact":"medium","impactLabel":"注目","searchQuery":"NFT メタバース 投資詐欺 2024"},{"id":12,"date":"2024-05","cat":"law","catLabel":"法規制・対策","source":"金融庁","title":"改正資金決済法・金商法が本格施行、無登録業者の暗号資産取引仲介に刑事罰が強化","body":"改正資金決済法・金融商品取引法の関連規定が本格施行され、無登録で暗号資産の取引仲介や投資助言を行う業者への刑事罰が強化された。金融庁は法施行に伴い、無登録業者への対処を積極化する方針を示した。","impact":"info","impactLabel":"制度情報","searchQuery":"資金決済法 金商法 改正 暗号資産 2024"},{"id":13,"date":"2024-04","cat":"ponzi","catLabel":"ポンジ・スキーム","source":"財務省・警察庁","title":"海外不動産投資ファンドを装ったポンジ詐欺、投資家200名超から約10億円を詐取","body":"「東南アジア不動産開発への投資で年利15%」と謳い出資を募っていた会社の実態がポンジ・スキームであることが判明。2024年春に強制捜査が入り、代表者らが詐欺容疑で逮捕された。","impact":"high","impactLabel":"重要","searchQuery":"海外不動産 投資ファンド ポンジ 詐欺 逮捕 2024"},{"id":14,"date":"2024-03","cat":"sns","catLabel":"SNS型","source":"警察庁","title":"警察庁が2023年のSNS型投資詐欺統計を公表、被害額277億円・件数5,631件で過去最高","body":"警察庁は2023年のSNS型投資詐欺の認知状況を公表。認知件数は5,631件（前年比約2.3倍）、被害額は約277億円（同約2.7倍）といずれも過去最高を記録。LINE・Instagramを介した勧誘が全体の7割超を占めた。","impact":"high","impactLabel":"重要","searchQuery":"警察庁 SNS型投資詐欺 2023年統計"},{"id":15,"date":"2024-02","cat":"romance","catLabel":"ロマンス詐欺","source":"消費者庁","title":"消費者庁が「SNS型ロマンス詐欺」に関する注意喚起を強化、被害の実態調査結果を公表","body":"消費者庁は2024年2月にSNS型ロマンス詐欺の被害実態調査結果を公表。被害者の平均被害額は約300万円、「投資で増やせる」と言われて送金した事例が多数を占めた。特に初期段階での相談が回収率を高めると強調した。","impact":"high","impactLabel":"重要","searchQuery":"消費者庁 SNS型ロマンス詐欺 調査 2024"},{"id":16,"date":"2024-01","cat":"stock","catLabel":"未公開株・社債","source":"証券取引等監視委員会","title":"投資詐欺「劇場型詐欺」に注意、被害回復を装い二次被害が急増","body":"過去に投資詐欺被害にあった方に「被害を回復できる」と近づき、追加の費用を要求して再びだまし取る「劇場型詐欺」が急増。証券取引等監視委員会は被害者名簿が詐欺グループ間で売買されていると指摘した。","impact":"high","impactLabel":"重要","searchQuery":"劇場型詐欺 投資詐欺 二次被害 2024"}],"order":{"newest":{"all":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15],"law":[0,3,6,11],"sns":[1,9,13],"romance":[2,7,14],"crypto":[4,10],"ponzi":[5,12],"stock":[8,15]},"oldest":{"all":[15,14,13,12,11,10,8,9,6,7,5,3,4,1,2,0],"law":[11,6,3,0],"sns":[13,9,1],"romance":[14,7,2],"crypto":[10,4],"ponzi":[12,5],"stock":[15,8]},"impact":{"all":[0,1,2,3,4,5,12,13,14,15,6,7,8,9,10,11],"law":[0,3,6,11],"sns":[1,13,9],"romance":[2,14,7],"crypto":[4,10],"ponzi":[5,12],"stock":[15,8]}},"index":{"00":[5,7,2],"02":[1,11,1,1],"0万":[14],"0代":[2],"0倍":[10],"0億":[12],"0名":[5,7],"0社":[3],"10":[5,5,2],"15":[12],"1件":[13],"20":[1,1,3,7,1,1],"23":[13],"24":[1,11,2],"27":[13],"2月":[14],"30":[14],"31":[13],"3倍":[13],"3年":[13],"40":[2,1],"4年":[1,11,2],"63":[13],"77":[13],"7倍":[13],"7億":[13],"7割":[13],"ac":[1,5],"ag":[1,5,7],"ai":[6],"am":[1,5,7],"bo":[1,5],"ce":[1,5],"eb":[1,5],"fa":[1,5],"ft":[10],"fx":[5],"gr":[1,5,7],"in":[1,5,7],"iを":[6],"kや":[1],"li":[13],"mを":[13],"m上":[1],"ne":[13],"nf":[10],"ns":[0,1,1,1,2,1,1,2,4,1],"ok":[1,5],"oo":[1,5],"ra":[1,5,7],"sn":[0,2,1,2,1,1,2,4,1],"st":[1,5,7],"sを":[5],"sプ":[0,6,3],"s上":[3],"s事":[0],"s型":[0,2,11,1],"s大":[6],"s経":[3],"ta":[1,5,7],"tや":[10],"tを":[10],"x自":[5],"あっ":[15],"ある":[3,9],"いず":[13],"いた":[5,2,5],"いの":[3],"いる":[1,1,1,5,1,1,5],"い二":[15],"い出":[12],"い勧":[5],"い未":[8],"い株":[8],"い続":[5],"うす":[8],"う業":[11],"う疑":[3],"う詐":[10],"およ":[9],"かけ":[3,6],"から":[2,10],"が2":[13],"がs":[6],"がっ":[2],"がポ":[12],"が入":[12],"が全":[13],"が再":[8],"が判":[2,10],"が回":[14],"が報":[9],"が増":[4,6],"が多":[4,10],"が対":[6],"が広":[2],"が強":[11],"が急":[1,1,13],"が拡":[10],"が摘":[5],"が本":[11],"が注":[4,4],"が無":[3],"が相":[9],"が若":[10],"が詐":[12,3],"が警":[10],"が過":[1],"が顔":[9],"きな":[4],"きる":[10,5],"くな":[4],"くり":[4],"く呼":[3],"ぐ上":[8],"けた":[3,6],"けて":[5],"ける":[0,8],"こと":[2,7,3],"され":[5,2,2,2,1,3],"した":[0,1,3,2,1,3,1,2,1,1],"して":[1,1,1,2,2,1,2,5],"しな":[8],"し取":[15],"し広":[6],"し法":[9],"し要":[4],"じて":[5],"じら":[9],"すぐ":[8],"すま":[6],"する":[0,3,1,4,2,1,3],"ずれ":[13],"ず自":[5],"せず":[5],"せる":[14],"そっ":[4],"たに":[3],"たポ":[12],"た事":[14],"た会":[12],"た偽":[1,3],"た勧":[13],"た国":[7],"た広":[6],"た投":[1],"た方":[15],"た相":[2],"た組":[7],"た著":[9],"た詐":[5],"だっ":[7],"だま":[15],"っく":[4],"った":[2,5,1,4,3],"って":[2,6,4],"つけ":[8],"づき":[15],"てい":[1,1,1,2,2,1,1,1,2,3],"て再":[15],"て注":[8],"て送":[14],"て高":[8],"であ":[12],"でき":[4,6,5],"での":[14],"で勧":[3],"で増":[1,13],"で売":[8,7],"で年":[12],"で摘":[7],"で日":[3,4],"で暗":[11],"で知":[2],"で確":[10],"で著":[1],"で逮":[12],"で過":[13],"で配":[5],"で金":[3],"で高":[10],"とい":[13],"とが":[2,7,3],"とし":[7,1],"との":[7],"と偽":[8],"と審":[6],"と強":[14],"と指":[15],"と発":[1],"と言":[14],"と謳":[5,5,2],"と近":[15],"と金":[10],"どと":[10],"どを":[4],"ない":[8],"なく":[4],"など":[4,6],"なり":[6],"なる":[4],"な投":[6],"に1":[10],"にs":[14],"にあ":[15],"にし":[7],"には":[5],"にも":[2],"によ":[1],"に伴":[11],"に作":[4],"に入":[1],"に出":[4,1],"に刑":[11],"に初":[14],"に実":[9],"に対":[6,3],"に強":[12],"に投":[2,4,9],"に掲":[3],"に注":[15],"に被":[10],"に複":[7],"に誘":[4],"に追":[4],"に関":[14],"に顔":[9],"の7":[13],"のs":[2,11],"のあ":[3],"のな":[8],"のプ":[0],"の優":[8],"の共":[7],"の刑":[11],"の取":[11],"の報":[6],"の実":[12,2],"の対":[11],"の市":[7],"の平":[14],"の広":[0],"の強":[6],"の投":[5,5,2],"の暗":[4,6,1],"の株":[8],"の検":[0],"の業":[3],"の法":[9],"の無":[9],"の画":[1],"の相":[2,12],"の窓":[9],"の組":[7],"の若":[2],"の被":[1,8,5],"の規":[0],"の詐":[3,2],"の認":[13],"の調":[2],"の費":[15],"の迅":[0,6],"の関":[11],"の高":[2],"は2":[13,1],"は5":[13],"はa":[6],"は主":[6],"は法":[11],"は無":[3],"は特":[1],"は約":[13,1],"は被":[9,6],"は運":[5],"は関":[0],"びか":[3,6],"びだ":[15],"び増":[8],"び詐":[9],"への":[0,5,4,1,1,1],"へ誘":[4],"まし":[6,9],"めた":[13,1],"めて":[8,1],"めら":[2],"める":[14],"もう":[8],"も被":[2],"も過":[13],"やi":[1],"やせ":[14],"やメ":[10],"や価":[8],"や実":[9],"や投":[11],"よび":[9],"よる":[1],"ら2":[2],"らが":[12],"られ":[2,2,5],"ら約":[12],"りf":[5],"りす":[6],"りつ":[8],"りに":[4],"り合":[2],"り返":[4],"るs":[0],"るこ":[2,7,3],"ると":[1,7,2,4,1],"るフ":[4],"る優":[8],"る手":[4],"る投":[1],"る方":[11],"る業":[3],"る法":[0],"る注":[14],"る海":[3],"る被":[4,6],"る電":[8],"れた":[4,1,2,2,2,1],"れて":[14,1],"れも":[13],"れる":[2],"われ":[14],"を中":[10],"を介":[13],"を先":[10],"を公":[13,1],"を募":[12],"を勧":[2,1],"を占":[13,1],"を受":[0],"を名":[4,1],"を呼":[9],"を回":[15],"を国":[7],"を強":[3,11],"を悪":[1],"を払":[5],"を拠":[7],"を摘":[5],"を新":[3],"を更":[3],"を検":[0],"を標":[7],"を活":[6],"を無":[1,8],"を特":[8],"を発":[4,2],"を直":[10],"を示":[11],"を積":[11],"を繰":[4],"を義":[0],"を行":[3,5,3],"を表":[6],"を被":[7],"を装":[12,3],"を要":[6,9],"を記":[13],"を設":[0],"を詐":[10,2],"を追":[3],"を通":[5],"を進":[9],"を開":[0,1],"を集":[5],"を高":[14],"ァン":[12],"アを":[7],"アジ":[7,5],"アプ":[2,5],"ア不":[12],"ア拠":[7],"ィッ":[4],"イト":[4],"イン":[7],"ェク":[0,10],"ォー":[0,6,3],"キー":[12],"クト":[0,10],"グア":[2,5],"グル":[5,2,2,6],"グ型":[4],"サイ":[4],"シン":[4],"ジア":[7,5],"ジェ":[0,10],"ジ詐":[12],"スで":[1],"スキ":[12],"スト":[3],"ス投":[10],"ス詐":[2,5,7],"ス関":[10],"タバ":[10],"ター":[7],"タ社":[6],"チン":[2,5],"チー":[0],"ッシ":[4],"ッチ":[2,5],"ット":[0,6,3],"ツー":[5],"トに":[4],"トへ":[4,6],"トを":[3],"トチ":[0],"トフ":[0,6,3],"ドを":[12],"バー":[10],"ファ":[12],"フィ":[4],"フォ":[0,6,3],"プが":[5,2],"プへ":[9],"プを":[5,2],"プラ":[0,6,3],"プリ":[2,5],"プロ":[0,10],"プ間":[15],"ペー":[1],"ポン":[12],"ポー":[7],"マッ":[2,5],"マン":[2,5,7],"ムお":[9],"ムで":[12],"ムへ":[0],"ムを":[0],"ム事":[6],"メタ":[6,4],"ラッ":[0,6,3],"リで":[2,5],"リス":[3],"リ起":[2],"ルへ":[5],"ルー":[5,2,2,6],"ロジ":[0,10],"ロマ":[2,5,7],"ング":[2,2,3],"ンジ":[12],"ンス":[2,5,7],"ンタ":[7],"ンド":[12],"ース":[1,9],"ープ":[5,2,2,6],"ーポ":[7],"ーム":[0,6,3,3],"ール":[5,2],"万円":[14],"上で":[1,2],"上場":[8],"不動":[12],"中心":[2,8],"主要":[6],"事例":[14],"事業":[0,6],"事罰":[11],"事警":[7],"二次":[15],"人が":[9],"人の":[1],"人や":[9],"人を":[7],"人投":[3],"介し":[13],"介に":[11],"介や":[11],"付け":[0],"代に":[2],"代の":[2],"代表":[12],"仲介":[11],"件で":[13],"件数":[1,1,11],"企業":[8],"会は":[8,1,6],"会社":[12],"伴い":[11],"体の":[13],"体制":[6],"作ら":[4],"使用":[1,8],"例が":[14],"価値":[8],"係省":[0],"保証":[5],"値の":[8],"偽っ":[8],"偽の":[4],"偽る":[8],"偽広":[0,1],"備の":[0],"備を":[9],"像の":[9],"像を":[1],"億円":[5,7,1],"優良":[8],"充を":[6],"先行":[10],"入で":[10],"入り":[1,11],"入金":[4],"全体":[13],"公表":[13,1],"公開":[8],"共同":[7],"円を":[12],"円規":[5],"再び":[8,7],"再燃":[8],"写真":[9],"処を":[11],"出し":[4],"出資":[5,7],"出金":[4],"刑事":[7,4],"初期":[14],"判明":[2,10],"別提":[8],"利1":[12],"利2":[5],"利回":[5],"制強":[0,6],"制捜":[12],"券取":[8,7],"券監":[8],"削除":[0,6],"前の":[3,5],"前を":[9],"前年":[13],"割超":[13],"劇場":[15],"加し":[1,7],"加の":[15],"加送":[4],"助言":[11],"動売":[5],"動産":[12],"務付":[0],"務省":[6,6],"募っ":[12],"勧め":[2],"勧誘":[3,2,3,5],"化さ":[11],"化す":[11],"化と":[6],"化を":[0,6],"化要":[0],"南ア":[7,5],"占め":[13,1],"去に":[15],"去最":[1,12],"収率":[14],"取す":[10],"取る":[15],"取引":[3,1,4,3,4],"受け":[0],"口が":[4],"口を":[1],"口拡":[6],"口整":[9],"号資":[4,6,1],"合っ":[2],"合会":[9],"同広":[1],"同捜":[7],"同約":[13],"名人":[1,8],"名使":[9],"名前":[9],"名実":[1],"名目":[4,1,5],"名簿":[15],"名超":[5,7],"告が":[1,8],"告し":[10],"告に":[1,8],"告の":[0,6,3],"告審":[0,6],"告窓":[6],"告経":[1],"呼び":[3,6],"品取":[3,8],"員会":[8,7],"商品":[3,8],"商法":[11],"喚起":[4,4,6],"回り":[5],"回収":[14],"回復":[15],"国の":[7],"国際":[7],"在し":[8],"均被":[14],"型の":[4],"型ロ":[14],"型投":[0,13],"型詐":[15],"報じ":[9],"報告":[6],"場す":[8],"場前":[8],"場型":[15],"増し":[2],"増す":[0],"増や":[14],"増加":[1,3,4,2],"士連":[9],"売り":[8],"売買":[5,10],"外不":[12],"外拠":[3],"多に":[1],"多ペ":[1],"多数":[14],"多発":[4],"大し":[10],"大手":[6],"始し":[0],"委が":[8],"委員":[8,7],"存在":[8],"定が":[11],"実に":[10],"実名":[9],"実態":[12,2],"実業":[1,8],"実際":[5],"害が":[2,2,6,5],"害に":[15],"害の":[14],"害を":[15],"害回":[15],"害実":[14],"害拡":[2],"害申":[9],"害者":[1,4,2,7,1],"害額":[1,4,8,1],"家2":[12],"家が":[9],"家を":[3],"容疑":[12],"察庁":[0,1,3,3,5,1],"察機":[7],"審査":[0,6],"対し":[6,3],"対処":[11],"対策":[6],"導し":[4],"導す":[4],"少n":[10],"層に":[2],"層を":[10],"市民":[7],"希少":[10],"平均":[14],"年2":[14],"年に":[1],"年の":[13],"年利":[12],"年層":[2,8],"年春":[12],"年比":[13],"庁が":[3,1,6,3,1],"庁の":[2],"庁は":[1,2,8,2,1],"庁横":[0],"広が":[2],"広告":[0,1,5,3],"府が":[0],"府は":[0],"弁護":[9],"式を":[8],"引仲":[11],"引所":[4],"引業":[3],"引法":[11],"引等":[8,7],"強く":[3],"強制":[12],"強化":[0,6,5,3],"強調":[14],"当を":[5],"後に":[4],"後は":[4],"従来":[2],"復で":[15],"復を":[15],"心か":[2],"心に":[10],"急増":[0,1,1,13],"悪用":[1],"意喚":[4,4,6],"態が":[12],"態調":[14],"所サ":[4],"手に":[2,4],"手口":[4],"手数":[4],"払い":[5],"投資":[0,1,1,1,2,1,3,1,1,1,1,1,1],"拠点":[3,4],"拡充":[6],"拡大":[2,8],"指摘":[15],"捕さ":[12],"捜査":[7,5],"措置":[9],"掲載":[3],"提供":[8],"摘し":[15],"摘発":[1,4,2],"撲滅":[0],"操業":[5],"改め":[8],"改正":[11],"政府":[0],"数5":[13],"数が":[1,1],"数は":[13],"数を":[14],"数億":[5],"数国":[7],"数料":[4],"整備":[0,9],"断の":[0],"断使":[1,8],"新し":[3],"新た":[3],"方に":[15],"方針":[11],"施行":[11],"日本":[3,4,2],"春に":[12],"暗号":[4,6,1],"更新":[3],"最多":[1],"最高":[13],"月に":[14],"月利":[5],"期段":[14],"未公":[8],"本人":[3,4],"本弁":[9],"本格":[11],"本物":[4],"来の":[2],"東南":[7,5],"果を":[14],"査が":[12],"査で":[2,5],"査の":[6],"査体":[6],"査強":[0],"査結":[14],"株や":[8],"株を":[8],"株式":[8],"格施":[11],"検討":[0],"業で":[5],"業の":[8],"業を":[3],"業家":[1,8],"業者":[0,3,3,5],"極化":[11],"標的":[7],"横断":[0],"機構":[7],"次ぐ":[9],"次被":[15],"欺が":[4,4,2],"欺の":[13,1],"欺を":[0],"欺グ":[5,2,2,6],"欺容":[12],"欺広":[1,5,3],"欺撲":[0],"欺業":[3],"欺的":[6],"欺統":[13],"欺被":[15],"正資":[11],"段階":[14],"比約":[13],"民を":[7],"求し":[15],"求す":[4],"決済":[11],"況を":[13],"法が":[11],"法の":[11],"法整":[0],"法施":[11],"法的":[9],"注意":[4,4,6,1],"活用":[6],"海外":[3,9],"消費":[2,12],"済法":[11],"滅プ":[0],"点に":[7],"点の":[2,1,4],"無断":[1,8],"無登":[3,8],"物そ":[4],"特に":[14],"特別":[8],"特設":[1],"犯行":[7],"状況":[13],"率を":[14],"産の":[11],"産を":[10],"産取":[4,7],"産投":[12],"産詐":[4],"産開":[12],"用さ":[9],"用し":[1,5],"用せ":[5],"用に":[9],"用の":[9],"用を":[15],"由で":[3],"由の":[1],"申告":[9],"画像":[1,8],"疑い":[3],"疑で":[12],"発さ":[5,2],"発へ":[12],"発件":[1],"発出":[4],"発表":[1,5],"登録":[3,8],"的な":[6],"的に":[7],"的措":[9],"的犯":[7],"監視":[8,7],"目で":[10],"目に":[4,1],"目の":[5],"直撃":[10],"相手":[2],"相次":[9],"相談":[2,12],"省が":[6],"省は":[6],"省庁":[0],"知り":[2],"知件":[13],"知状":[13],"確実":[10],"確認":[3],"示し":[11],"社が":[6],"社の":[12],"社超":[3],"税金":[4],"積極":[11],"窓口":[1,5,3],"等監":[8,7],"策強":[6],"簿が":[15],"約1":[12],"約2":[13],"約3":[14],"組織":[7],"経由":[1,2],"結果":[14],"統計":[13],"続け":[5],"総務":[6],"織的":[7],"繰り":[4],"置を":[9],"罰が":[11],"義務":[0],"者1":[5],"者4":[3],"者と":[7],"者に":[6],"者の":[11,3],"者へ":[0,11],"者ら":[12],"者リ":[3],"者中":[2],"者名":[15],"者庁":[2,12],"者数":[1],"者確":[3],"能人":[1],"自動":[5],"自転":[5],"良企":[8],"良株":[8],"芸能":[1],"若年":[2,8],"著名":[1,8],"融商":[3,8],"融庁":[0,3,1,6,1],"行う":[3,8],"行さ":[11],"行だ":[7],"行っ":[8],"行に":[11],"行購":[10],"表し":[1,5],"表明":[6],"表者":[12],"被害":[1,1,2,1,2,2,1,3,1,1],"装い":[15],"装っ":[12],"複数":[7],"要s":[6],"要求":[4,11],"要請":[0,6],"規制":[0],"規定":[11],"規模":[5],"視委":[8,7],"視庁":[5],"言わ":[14],"言を":[11],"計を":[13],"討を":[0],"記録":[13],"設し":[1],"設窓":[1],"設置":[0],"証券":[8,7],"詐取":[10,2],"詐欺":[0,1,1,1,1,1,1,1,1,1,1,2,1,1,1],"話勧":[8],"認を":[3],"認知":[13],"誘が":[13],"誘し":[3,2],"誘す":[3],"誘導":[4],"誘詐":[8],"調し":[14],"調査":[2,12],"談が":[2,12],"談件":[2],"請や":[0],"謳い":[5,5,2],"謳う":[10],"警告":[10],"警察":[0,1,3,3,5,1],"警視":[5],"護士":[9],"財務":[12],"買さ":[15],"買ツ":[5],"費用":[15],"費者":[2,12],"資で":[10,2,2],"資を":[2,3,7],"資フ":[12],"資前":[3],"資助":[11],"資名":[10],"資家":[3,9],"資広":[6],"資産":[4,6,1],"資詐":[0,1,5,3,4,2],"資金":[11],"購入":[10],"起を":[4,4,6],"起点":[2],"超か":[12],"超を":[3,10],"車操":[5],"転車":[5],"迅速":[0,6],"近づ":[15],"返し":[4],"追加":[3,1,11],"送金":[4,10],"通じ":[5],"速削":[0,6],"連プ":[10],"連合":[9],"連規":[11],"逮捕":[12],"進め":[9],"運用":[5],"過去":[1,12,2],"配当":[5],"金し":[14],"金で":[4],"金を":[4],"金商":[11],"金後":[4],"金決":[11],"金融":[0,3,1,6,1],"針を":[11],"録で":[3,8],"録業":[3,8],"開始":[0],"開株":[8],"開発":[12],"開設":[1],"間で":[15],"関す":[14],"関係":[0],"関連":[10,1],"除と":[6],"除を":[0,6],"階で":[14],"際に":[5],"際ロ":[7],"際共":[7],"際刑":[7],"集め":[5],"電話":[8],"額2":[13],"額が":[1],"額で":[8],"額の":[10],"額は":[13,1],"額数":[5],"顔写":[9],"顔画":[9],"高め":[14],"高を":[13],"高利":[5],"高額":[8,2],"高齢":[2],"齢者":[2]}};